@@ -1,9 +1,11 @@
 import logging
+from functools import partial
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
-from PyQt5.QtCore import QPoint, Qt, pyqtSignal
-from PyQt5.QtGui import QBrush, QFontMetrics
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QObject, QPoint, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QBrush
 from PyQt5.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -13,15 +15,134 @@ from PyQt5.QtWidgets import (
     QMenu,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
 from utils.color_assets import ERROR_COLOR, NAN_COLOR, NON_NUM_COLOR
-from utils.data_utils import impute_values, one_hot_encode, validate_csv
+from utils.data_utils import categorize_strings, impute_values, one_hot_encode, read_csv, validate_csv
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    A read-only table model that exposes a DataFrame to a QTableView.
+
+    Cells are formatted on demand in data(), so only the cells Qt actually paints are ever converted to text,
+    instead of creating one item per cell up front.
+    """
+
+    def __init__(self, df: pd.DataFrame | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self._df: pd.DataFrame = pd.DataFrame()
+        self._columns: List[np.ndarray] = []
+        self._backgrounds: List[QBrush | None] = []
+        if df is not None:
+            self.set_dataframe(df)
+
+    def set_dataframe(self, df: pd.DataFrame) -> None:
+        """
+        Replaces the DataFrame shown by the model.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to display.
+
+        Returns:
+            None
+        """
+        self.beginResetModel()
+        self._set_frame(df)
+        self.endResetModel()
+
+    def _set_frame(self, df: pd.DataFrame) -> None:
+        self._df = df
+        # One array per column keeps each cell lookup a positional numpy index, whatever the frame's index is
+        self._columns = [df.iloc[:, i].to_numpy() for i in range(df.shape[1])]
+        # Highlighting is decided per column, so it is computed once here rather than per painted cell
+        nan_columns = df.isnull().any().to_numpy()
+        self._backgrounds = []
+        for i in range(df.shape[1]):
+            if not pd.api.types.is_numeric_dtype(df.iloc[:, i]):
+                self._backgrounds.append(QBrush(NON_NUM_COLOR))
+            elif nan_columns[i]:
+                self._backgrounds.append(QBrush(NAN_COLOR))
+            else:
+                self._backgrounds.append(None)
+
+    def dataframe(self) -> pd.DataFrame:
+        """
+        Returns the DataFrame shown by the model.
+
+        Returns:
+            pd.DataFrame: The displayed DataFrame, in its current sort order.
+        """
+        return self._df
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._df.shape[1]
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self._columns[index.column()][index.row()])
+        if role == Qt.BackgroundRole:
+            return self._backgrounds[index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return str(self._df.columns[section])
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        if not 0 <= column < self._df.shape[1]:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._set_frame(
+            self._df.sort_values(
+                self._df.columns[column], ascending=order == Qt.AscendingOrder, kind="stable", na_position="last"
+            )
+        )
+        self.layoutChanged.emit()
+
+
+class CSVLoaderSignals(QObject):
+    # QRunnable is not a QObject, so the loader reports back through this companion object
+    loaded = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class CSVLoader(QRunnable):
+    """Parses a CSV file on a thread pool and reports the DataFrame or error message back through signals."""
+
+    def __init__(self, csv_file: str) -> None:
+        super().__init__()
+        self._csv_file = csv_file
+        self.signals = CSVLoaderSignals()
+
+    def run(self) -> None:
+        try:
+            df = read_csv(self._csv_file)
+            # Shrink repeated labels here, off the GUI thread, before the frame is shared with the other views
+            categorized_df = categorize_strings(df)
+            if categorized_df is not df:
+                before = df.memory_usage(deep=True).sum()
+                after = categorized_df.memory_usage(deep=True).sum()
+                logging.info(f"Stored repeated strings as categories: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+            df = categorized_df
+        except Exception as e:
+            logging.error(f"Error reading CSV file '{self._csv_file}': {e}")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.loaded.emit(df)
+        finally:
+            self.signals.finished.emit()
 
 
 class CSVView(QWidget):
@@ -44,7 +165,9 @@ class CSVView(QWidget):
         condition_dropdown (QComboBox): The dropdown for selecting a condition for filtering.
         value_edit (QLineEdit): The text field for entering a value for filtering.
         filter_button (QPushButton): The button for applying a filter.
-        table_widget (QTableWidget): The table widget for displaying the CSV data.
+        table_model (DataFrameModel): The model exposing the displayed DataFrame to the table view.
+        table_widget (QTableView): The table view for displaying the CSV data.
+        csv_loader (CSVLoader | None): The loader parsing a CSV file in the background, if one is running.
 
     Methods:
         create_error_label() -> QLabel:
@@ -55,7 +178,7 @@ class CSVView(QWidget):
 
         create_filter_button() -> QPushButton:
 
-        create_table_widget() -> QTableWidget:
+        create_table_widget() -> QTableView:
 
         create_filter_layout() -> QHBoxLayout:
 
@@ -63,6 +186,8 @@ class CSVView(QWidget):
 
         display_csv_image(csv_file: str) -> None:
 
+        shutdown() -> None:
+
         undo() -> None:
 
         redo() -> None:
@@ -81,6 +206,10 @@ class CSVView(QWidget):
         self.df: pd.DataFrame = pd.DataFrame()
         self.undo_stack: List[pd.DataFrame] = []
         self.redo_stack: List[pd.DataFrame] = []
+        # CSV files are parsed on a pool thread so large files don't freeze the window; one load at a time
+        self.csv_loader: CSVLoader | None = None
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
 
         self.set_window_size_limits()
         self.layout = QVBoxLayout()
@@ -89,7 +218,9 @@ class CSVView(QWidget):
         self.load_button = self.create_load_button()
         self.column_dropdown, self.condition_dropdown, self.value_edit = self.create_filter_widgets()
         self.filter_button = self.create_filter_button()
+        self.table_model = DataFrameModel(parent=self)
         self.table_widget = self.create_table_widget()
+        self.table_widget.setModel(self.table_model)
 
         self.impute_button = self.create_impute_button()
 
@@ -232,15 +363,15 @@ class CSVView(QWidget):
         filter_button.clicked.connect(self.filter_data)
         return filter_button
 
-    def create_table_widget(self) -> QTableWidget:
+    def create_table_widget(self) -> QTableView:
         """
-        Creates and returns a QTableWidget object.
+        Creates and returns a QTableView object.
 
         Returns:
-            QTableWidget: The created QTableWidget object.
+            QTableView: The created QTableView object.
         """
         logging.debug("Creating table widget.")
-        table_widget = QTableWidget(self)
+        table_widget = QTableView(self)
         table_widget.setSortingEnabled(True)
         return table_widget
 
@@ -277,23 +408,43 @@ class CSVView(QWidget):
         if file_name:
             logging.info(f"Selected CSV file: {file_name}")
             self.display_csv_image(file_name)
-            self.data_ready.emit(self.df)
         else:
             logging.info("No file selected")
 
     def display_csv_image(self, csv_file: str) -> None:
         """
-        Display the CSV file as an image in the GUI.
+        Starts loading a CSV file in the background and displays it in the table once it has been parsed.
 
         Args:
             csv_file (str): The path to the CSV file.
 
+        Returns:
+            None
+        """
+        logging.info(f"Reading CSV file: {csv_file}")
+        self.load_button.setEnabled(False)
+        self.setCursor(Qt.BusyCursor)
+
+        # Kept on self so its signals object outlives the load
+        self.csv_loader = CSVLoader(csv_file)
+        self.csv_loader.signals.loaded.connect(partial(self.on_csv_loaded, csv_file))
+        self.csv_loader.signals.error.connect(partial(self.on_csv_error, csv_file))
+        self.csv_loader.signals.finished.connect(self.on_csv_finished)
+        self._thread_pool.start(self.csv_loader)
+
+    def on_csv_loaded(self, csv_file: str, df: pd.DataFrame) -> None:
+        """
+        Displays a DataFrame parsed by the CSV loader.
+
+        Args:
+            csv_file (str): The path to the CSV file.
+            df (pd.DataFrame): The parsed CSV data.
+
         Returns:
             None
         """
         try:
-            logging.info(f"Reading CSV file: {csv_file}")
-            self.df = pd.read_csv(csv_file)
+            self.df = df
             logging.info(f"CSV file '{csv_file}' read successfully.")
 
             int_columns = self.df.select_dtypes(include="int").columns
@@ -317,6 +468,46 @@ class CSVView(QWidget):
             self.show_error_message("Error loading CSV file", str(e))
             logging.error(f"Error loading CSV file '{csv_file}': {e}")
 
+    def on_csv_error(self, csv_file: str, message: str) -> None:
+        """
+        Reports a CSV file the loader could not parse.
+
+        Args:
+            csv_file (str): The path to the CSV file.
+            message (str): The error message.
+
+        Returns:
+            None
+        """
+        self.show_error_message("Error loading CSV file", message)
+        logging.error(f"Error loading CSV file '{csv_file}': {message}")
+
+    def on_csv_finished(self) -> None:
+        """
+        Re-enables loading once the CSV loader is done, whether it succeeded or not.
+
+        Returns:
+            None
+        """
+        self.csv_loader = None
+        self.load_button.setEnabled(True)
+        self.unsetCursor()
+
+    def shutdown(self) -> None:
+        """
+        Drops a queued CSV load and waits for a running one, so its results never reach a view being destroyed.
+
+        Called by the main window: as a tab page, the view never receives a closeEvent of its own.
+
+        Returns:
+            None
+        """
+        self._thread_pool.clear()
+        if self.csv_loader is not None:
+            self.csv_loader.signals.loaded.disconnect()
+            self.csv_loader.signals.error.disconnect()
+        self._thread_pool.waitForDone()
+
     def undo(self) -> None:
         """
         Undo the last operation.
@@ -474,23 +665,19 @@ class CSVView(QWidget):
         """
         try:
             logging.debug("Adjusting window size based on table content.")
-            row_count = self.table_widget.rowCount()
-            column_count = self.table_widget.columnCount()
+            row_count = self.table_model.rowCount()
+            column_count = self.table_model.columnCount()
 
             if column_count == 0 or row_count == 0:
                 logging.warning("No data to adjust window size.")
                 return
 
-            row_height = max(self.table_widget.verticalHeader().sectionSize(i) for i in range(row_count)) + 10
+            row_height = self.table_widget.verticalHeader().defaultSectionSize() + 10
 
-            font_metrics = QFontMetrics(self.font())
-            total_column_width = sum(
-                max(
-                    font_metrics.width(str(self.table_widget.item(row_index, col).text()))
-                    for row_index in range(row_count)
-                )
-                for col in range(column_count)
-            ) + (column_count * 75)
+            # The view measures the rows it would lay out, rather than formatting every cell of the frame
+            total_column_width = sum(self.table_widget.sizeHintForColumn(col) for col in range(column_count)) + (
+                column_count * 75
+            )
 
             new_height = min(self.max_height, row_count * row_height + 10)
             new_width = min(self.max_width, total_column_width)
@@ -554,26 +741,7 @@ class CSVView(QWidget):
             None
         """
         logging.debug("Updating table with new data.")
-        self.table_widget.clear()
-        self.table_widget.setRowCount(len(df))
-        self.table_widget.setColumnCount(len(df.columns))
-        self.table_widget.setHorizontalHeaderLabels(df.columns)
-
-        for col_index, column in enumerate(df.columns):
-            has_nan = df[column].isnull().any()
-            is_numerical = pd.api.types.is_numeric_dtype(df[column])
-
-            for row_index in range(len(df)):
-                item = QTableWidgetItem(str(df.at[row_index, column]))
-
-                if has_nan:
-                    item.setBackground(QBrush(NAN_COLOR))
-
-                if not is_numerical:
-                    item.setBackground(QBrush(NON_NUM_COLOR))
-
-                self.table_widget.setItem(row_index, col_index, item)
-
+        self.table_model.set_dataframe(df)
         self.table_widget.resizeColumnsToContents()
         logging.info("Table updated successfully.")
 
@@ -645,13 +813,14 @@ class CSVView(QWidget):
 
         """
         if condition == "Contains":
-            return self.df[self.df[column_name].str.contains(value)]
+            # Literal, vectorised match; missing values never match instead of poisoning the mask with NaN
+            return self.df[self.text_column(column_name).str.contains(value, regex=False, na=False)]
         elif condition == "Equals":
             return self.df[self.df[column_name] == value]
         elif condition == "Starts with":
-            return self.df[self.df[column_name].str.startswith(value)]
+            return self.df[self.text_column(column_name).str.startswith(value, na=False)]
         elif condition == "Ends with":
-            return self.df[self.df[column_name].str.endswith(value)]
+            return self.df[self.text_column(column_name).str.endswith(value, na=False)]
         elif condition in (">=", "<=", ">", "<"):
             try:
                 numeric_column = self.df[column_name].astype(float)
@@ -670,6 +839,22 @@ class CSVView(QWidget):
         else:
             raise ValueError("Invalid filter condition")
 
+    def text_column(self, column_name: str) -> pd.Series:
+        """
+        Returns a column as strings so the text filter conditions work on any dtype.
+
+        Parameters:
+            column_name (str): The name of the column.
+
+        Returns:
+            pd.Series: The column itself if it already holds strings, otherwise its values converted to strings
+            with missing values kept as missing.
+        """
+        column = self.df[column_name]
+        if pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            return column
+        return column.astype("string")
+
     def copy_selected_values(self) -> None:
         """
         Copies the selected values from the table widget.
@@ -680,8 +865,8 @@ class CSVView(QWidget):
         Raises:
             None
         """
-        selected_items = self.table_widget.selectedItems()
-        if not selected_items:
+        selected_indexes = self.table_widget.selectionModel().selectedIndexes()
+        if not selected_indexes:
             logging.warning("No cells selected to copy.")
             self.show_error_message("Copy Error", "No cells selected to copy.")
             return
@@ -738,12 +923,12 @@ class CSVView(QWidget):
             pos (QPoint): The position where the context menu is requested.
         """
         logging.debug(f"Context menu requested at position: {pos}")
-        item = self.table_widget.itemAt(pos)
+        index = self.table_widget.indexAt(pos)
 
-        if not item:
+        if not index.isValid():
             return
 
-        column_index = item.column()
+        column_index = index.column()
         column_name = self.df.columns[column_index]
         logging.debug(f"Context menu for column: {column_name}")
 
@@ -751,7 +936,7 @@ class CSVView(QWidget):
         context_menu.addAction("Undo", self.undo)
         context_menu.addAction("Redo", self.redo)
 
-        if self.df[column_name].dtype == "object":
+        if self.df[column_name].dtype == "object" or isinstance(self.df[column_name].dtype, pd.CategoricalDtype):
             context_menu.addMenu(self.create_one_hot_menu(column_name))
         elif self.df[column_name].isnull().any():
             context_menu.addMenu(self.create_impute_menu(column_name))
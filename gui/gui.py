@@ -1,5 +1,6 @@
 import logging
 import sys
+from functools import partial
 
 import pandas as pd
 from PyQt5.QtWidgets import QApplication, QTabWidget, QVBoxLayout, QWidget
@@ -33,20 +34,31 @@ class CSVInteractiveApp(QWidget):
 
         # Connect signals
         self.csv_view.data_ready.connect(self.plotting_widget.update_data)
-        self.csv_view.data_ready.connect(self.ml_view.update_column_selection)
-
-        def on_data_ready(df: pd.DataFrame):
-            # self.ml_view.set_dataframe(self.csv_view.get_dataframe())
-            self.ml_view.set_dataframe(df)
-
-        self.csv_view.data_ready.connect(on_data_ready)
+        # set_dataframe also refreshes the ML view's column widgets, so it is the only ML view receiver. The CSV
+        # loader has already stored repeated strings as categories, so the ML view does not scan them again.
+        self.csv_view.data_ready.connect(partial(self.ml_view.set_dataframe, categorized=True))
 
         # Set layout
         self.layout.addWidget(self.tab_widget)
         self.setLayout(self.layout)
 
+        # Also covers quitting without closing the window (e.g. from the OS menu), whichever entry point started
+        # the app
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
         logging.info("CSVInteractiveApp initialized successfully.")
 
+    def shutdown(self) -> None:
+        # Tabs never receive a closeEvent of their own, so their background work is stopped from here
+        self.csv_view.shutdown()
+        self.ml_view.shutdown()
+
+    def closeEvent(self, event) -> None:
+        self.shutdown()
+        super().closeEvent(event)
+
 
 if __name__ == "__main__":
     setup_logging()
@@ -1,9 +1,15 @@
 import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QStringListModel, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QComboBox,
     QDialog,
@@ -12,14 +18,99 @@ from PyQt5.QtWidgets import (
     QFormLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
+    QListView,
     QMessageBox,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
-from ml_backend.ml_backend import download_results_as_json, run_ml_methods
+from utils.data_utils import categorize_strings
+from utils.gui_utils import updates_suppressed
+from utils.logging_config import profiled
+
+# Names offered in the method list; they match the keys of ml_backend's MODEL_MAPPING, which is not imported
+# here so scikit-learn stays unloaded until a run
+ML_METHOD_NAMES = (
+    "Linear Regression",
+    "Ridge Regression",
+    "Lasso Regression",
+    "ElasticNet Regression",
+    "Decision Trees",
+    "Random Forest",
+    "Support Vector Machines",
+    "Neural Networks",
+    "Gradient Boosting",
+    "AdaBoost",
+)
+
+# Applied once on MLView; Qt parses the rule a single time and cascades it to the matching buttons
+ML_VIEW_STYLE = "QPushButton#actionButton { background-color: #007bff; color: white; font-weight: bold; }"
+
+# Above this many points, markers are drawn through Line2D, which Agg renders by stamping one cached marker
+LARGE_SCATTER_THRESHOLD = 5000
+
+# (label, result key) pairs shown in the results dialog, in display order
+RESULT_METRICS = (
+    ("CV Mean Score", "cv_mean_score"),
+    ("CV Std Score", "cv_std_score"),
+    ("Train MSE", "train_mse"),
+    ("Test MSE", "test_mse"),
+    ("Train R2", "train_r2"),
+    ("Test R2", "test_r2"),
+)
+
+# Set CHEMML_RESULT_CACHE_DIR to a directory to keep fitted results on disk between sessions; off by default
+RESULT_CACHE_DIR_ENV = "CHEMML_RESULT_CACHE_DIR"
+
+# Delay before a target change rebuilds the feature list
+TARGET_DEBOUNCE_MS = 150
+
+# Worker processes in the fitting pool, i.e. the most methods fitted at the same time
+MAX_FIT_PROCESSES = min(8, os.cpu_count() or 1)
+
+# Default cap on the rows used for training, so the first result on a large dataset arrives in seconds
+DEFAULT_MAX_TRAINING_ROWS = 10000
+
+
+def _terminate_pool(pool: ProcessPoolExecutor) -> None:
+    # shutdown(cancel_futures=True) only drops the queued fits: a running grid search keeps its process, and the
+    # job waiting on it, busy for minutes. Killing the workers makes that job fail at once with BrokenProcessPool.
+    if hasattr(pool, "terminate_workers"):  # Python 3.14+
+        pool.terminate_workers()
+        return
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+class MLWorkerSignals(QObject):
+    # QRunnable is not a QObject, so the worker reports back through this companion object
+    result_ready = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class MLWorker(QRunnable):
+    """Runs an ML job on a thread pool and reports its results or error message back through signals."""
+
+    def __init__(self, job) -> None:
+        super().__init__()
+        self._job = job
+        self.signals = MLWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            results = self._job()
+        except Exception as e:
+            logging.getLogger("MLView").error(f"Error running ML methods: {e}", exc_info=True)
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result_ready.emit(results)
+        finally:
+            self.signals.finished.emit()
 
 
 class MLView(QWidget):
@@ -29,6 +120,41 @@ class MLView(QWidget):
         super().__init__()
         self.logger: logging.Logger = logging.getLogger("MLView")
         self.df = pd.DataFrame()
+        # Dense copy of the numeric columns plus a name -> column index, so runs slice arrays instead of the frame.
+        # Built on the first run after a DataFrame is set.
+        self._X_full: np.ndarray | None = None
+        self._col_idx: dict[str, int] = {}
+        self._columns_cache: list = []
+        self._column_positions: dict[str, int] = {}
+        self._shown_columns: tuple = ()
+        # (DataFrame hash, target, features, training rows) -> {method: result}, so a run or plot only fits the
+        # methods not yet trained on that data. Cleared whenever a DataFrame with different contents is set.
+        self._results_cache: dict[tuple, dict[str, dict]] = {}
+        self._df_hash: int | None = None
+        # Fitted results can also be kept on disk across sessions, keyed by a hash of the training data; None disables
+        self.result_cache_dir: str | None = os.environ.get(RESULT_CACHE_DIR_ENV) or None
+        self._best_method: str | None = None
+        self._plot_fig = None
+        self._plot_canvas = None
+        self._plot_dialog: QDialog | None = None
+        # pyqtgraph plot window, used for large result sets when pyqtgraph is installed
+        self._pg_dialog: QDialog | None = None
+        self._pg_layout = None
+        # Result box and plot-method picker are built on first use and reused, only their contents change
+        self._result_box: QMessageBox | None = None
+        self._result_save_button = None
+        self._plot_select_dialog: QDialog | None = None
+        self._plot_checkbox_layout: QVBoxLayout | None = None
+        self._plot_checkboxes: dict[str, QCheckBox] = {}
+        self._plot_methods: list = []
+        self._ml_worker: MLWorker | None = None
+        # One job at a time; a pool thread is reused across runs instead of starting a QThread per click
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+
+        # Kept alive across runs so each selected method can be fitted in its own process. Created on the first
+        # run, and shut down by the top-level window (a tab never gets a closeEvent)
+        self._pool: ProcessPoolExecutor | None = None
 
         self.setWindowTitle("Machine Learning View")
 
@@ -39,11 +165,40 @@ class MLView(QWidget):
         self.setup_run_ml_button()
 
         self.setLayout(self.main_layout)
+        self.setStyleSheet(ML_VIEW_STYLE)
         self.initialize_widgets()
         self.previous_target_column = None
 
         self.data_ready_signal.connect(self.update_column_selection)
-        self.target_combo.currentIndexChanged.connect(self.update_feature_columns)
+        # Stepping through targets with the arrow keys rebuilds the feature list once, after the last step
+        self._target_debounce = QTimer(self)
+        self._target_debounce.setSingleShot(True)
+        self._target_debounce.setInterval(TARGET_DEBOUNCE_MS)
+        self._target_debounce.timeout.connect(self.update_feature_columns)
+        # Not connected to start directly: start(int) would take the combo index as the interval
+        self.target_combo.currentIndexChanged.connect(lambda _index: self._target_debounce.start())
+
+    def closeEvent(self, event) -> None:
+        self.shutdown()
+        super().closeEvent(event)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # "spawn" avoids forking the Qt process; workers are only started on the first submit
+            self._pool = ProcessPoolExecutor(
+                max_workers=MAX_FIT_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Drop queued runs and kill the fitting processes without waiting for them; the next run starts anew."""
+        self._thread_pool.clear()
+        if self._ml_worker is not None:
+            # The running job now fails with BrokenProcessPool, which is not worth an error dialog
+            self._ml_worker.signals.error.disconnect(self._on_ml_error)
+        if self._pool is not None:
+            _terminate_pool(self._pool)
+            self._pool = None
 
     def setup_ml_methods_section(self) -> None:
         self.h_layout_ml_methods = QHBoxLayout()
@@ -52,22 +207,10 @@ class MLView(QWidget):
         self.ml_methods_label = QLabel("Select Machine Learning Methods:")
         self.left_column_layout.addWidget(self.ml_methods_label)
 
-        self.available_methods_list = QListWidget()
-        self.available_methods_list.setSelectionMode(QListWidget.MultiSelection)
-        self.available_methods_list.addItems(
-            [
-                "Linear Regression",
-                "Ridge Regression",
-                "Lasso Regression",
-                "ElasticNet Regression",
-                "Decision Trees",
-                "Random Forest",
-                "Support Vector Machines",
-                "Neural Networks",
-                "Gradient Boosting",
-                "AdaBoost",
-            ]
-        )
+        self._available_methods_model = QStringListModel(list(ML_METHOD_NAMES))
+        self.available_methods_list = QListView()
+        self.available_methods_list.setModel(self._available_methods_model)
+        self.available_methods_list.setSelectionMode(QAbstractItemView.MultiSelection)
         self.left_column_layout.addWidget(self.available_methods_list)
 
         self.move_right_button = QPushButton("→")
@@ -83,8 +226,10 @@ class MLView(QWidget):
         self.selected_methods_label = QLabel("Selected ML Methods")
         self.right_column_layout.addWidget(self.selected_methods_label)
 
-        self.selected_methods_list = QListWidget()
-        self.selected_methods_list.setSelectionMode(QListWidget.MultiSelection)
+        self._selected_methods_model = QStringListModel()
+        self.selected_methods_list = QListView()
+        self.selected_methods_list.setModel(self._selected_methods_model)
+        self.selected_methods_list.setSelectionMode(QAbstractItemView.MultiSelection)
         self.right_column_layout.addWidget(self.selected_methods_list)
 
         self.h_layout_ml_methods.addLayout(self.left_column_layout)
@@ -102,6 +247,14 @@ class MLView(QWidget):
         self.target_combo.addItem("Select Target Column")
 
         self.form_layout.addRow(self.target_label, self.target_combo)
+
+        self.sample_label = QLabel("Max Training Rows:")
+        self.sample_spin = QSpinBox()
+        self.sample_spin.setRange(0, 10_000_000)
+        self.sample_spin.setSingleStep(1000)
+        self.sample_spin.setSpecialValueText("All rows")
+        self.sample_spin.setValue(DEFAULT_MAX_TRAINING_ROWS)
+        self.form_layout.addRow(self.sample_label, self.sample_spin)
         self.h_layout_target.addLayout(self.form_layout)
 
         self.main_layout.addLayout(self.h_layout_target)
@@ -109,34 +262,40 @@ class MLView(QWidget):
     def setup_feature_columns_section(self) -> None:
         self.h_layout_features = QHBoxLayout()
 
-        self.left_column_layout = QVBoxLayout()
+        self.feature_left_column_layout = QVBoxLayout()
         self.feature_label = QLabel("Available Feature Columns:")
-        self.left_column_layout.addWidget(self.feature_label)
-
-        self.feature_list = QListWidget()
-        self.feature_list.setSelectionMode(QListWidget.MultiSelection)
-        self.left_column_layout.addWidget(self.feature_list)
-
-        self.move_right_button = QPushButton("→")
-        self.move_left_button = QPushButton("←")
-        self.move_right_button.clicked.connect(self.move_feature_to_selected)
-        self.move_left_button.clicked.connect(self.move_feature_to_available)
-
-        self.button_layout = QVBoxLayout()
-        self.button_layout.addWidget(self.move_right_button)
-        self.button_layout.addWidget(self.move_left_button)
-
-        self.right_column_layout = QVBoxLayout()
+        self.feature_left_column_layout.addWidget(self.feature_label)
+
+        # Feature lists can hold thousands of descriptor columns; like the method lists they are views over
+        # string list models, so repopulating or moving rows is one setStringList call instead of per-item work
+        self._feature_model = QStringListModel()
+        self.feature_list = QListView()
+        self.feature_list.setModel(self._feature_model)
+        self.feature_list.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.feature_left_column_layout.addWidget(self.feature_list)
+
+        self.feature_move_right_button = QPushButton("→")
+        self.feature_move_left_button = QPushButton("←")
+        self.feature_move_right_button.clicked.connect(self.move_feature_to_selected)
+        self.feature_move_left_button.clicked.connect(self.move_feature_to_available)
+
+        self.feature_button_layout = QVBoxLayout()
+        self.feature_button_layout.addWidget(self.feature_move_right_button)
+        self.feature_button_layout.addWidget(self.feature_move_left_button)
+
+        self.feature_right_column_layout = QVBoxLayout()
         self.selected_features_label = QLabel("Selected Feature Columns")
-        self.right_column_layout.addWidget(self.selected_features_label)
+        self.feature_right_column_layout.addWidget(self.selected_features_label)
 
-        self.selected_feature_list = QListWidget()
-        self.selected_feature_list.setSelectionMode(QListWidget.MultiSelection)
-        self.right_column_layout.addWidget(self.selected_feature_list)
+        self._selected_feature_model = QStringListModel()
+        self.selected_feature_list = QListView()
+        self.selected_feature_list.setModel(self._selected_feature_model)
+        self.selected_feature_list.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.feature_right_column_layout.addWidget(self.selected_feature_list)
 
-        self.h_layout_features.addLayout(self.left_column_layout)
-        self.h_layout_features.addLayout(self.button_layout)
-        self.h_layout_features.addLayout(self.right_column_layout)
+        self.h_layout_features.addLayout(self.feature_left_column_layout)
+        self.h_layout_features.addLayout(self.feature_button_layout)
+        self.h_layout_features.addLayout(self.feature_right_column_layout)
 
         self.main_layout.addLayout(self.h_layout_features)
 
@@ -144,14 +303,14 @@ class MLView(QWidget):
         self.run_ml_button = QPushButton("Run ML Methods")
         self.run_ml_button.clicked.connect(self.run_ml_methods_clicked)
 
-        self.run_ml_button.setStyleSheet("background-color: #007bff; color: white; font-weight: bold;")
+        self.run_ml_button.setObjectName("actionButton")
         self.run_ml_button.setFixedHeight(40)
 
         self.main_layout.addWidget(self.run_ml_button)
 
         self.plot_results_button = QPushButton("Plot Results")
         self.plot_results_button.clicked.connect(self.plot_results_clicked)
-        self.plot_results_button.setStyleSheet("background-color: #007bff; color: white; font-weight: bold;")
+        self.plot_results_button.setObjectName("actionButton")
         self.plot_results_button.setFixedHeight(40)
 
         self.main_layout.addWidget(self.plot_results_button)
@@ -164,95 +323,208 @@ class MLView(QWidget):
             self.selected_feature_list,
         ]:
             widget.setMinimumWidth(200)
+            # Every row is one line of text, so Qt can lay the list out from a single row height
+            widget.setUniformItemSizes(True)
 
     def set_column_names(self, columns: list) -> None:
         self.target_combo.clear()
         self.target_combo.addItem("Select Target Column")
         self.target_combo.addItems(columns)
 
+    @staticmethod
+    def _move_model_rows(source: QListView, target: QListView) -> None:
+        source_model = source.model()
+        rows = {index.row() for index in source.selectionModel().selectedIndexes()}
+        if not rows:
+            return
+
+        # Rebuild both string lists and reset each model once, whatever the number of moved rows
+        source_list = source_model.stringList()
+        with updates_suppressed(source, target):
+            source.selectionModel().clearSelection()
+            target.model().setStringList(target.model().stringList() + [source_list[row] for row in sorted(rows)])
+            source_model.setStringList([text for row, text in enumerate(source_list) if row not in rows])
+
+    @profiled
     def move_to_selected(self) -> None:
-        selected_items = self.available_methods_list.selectedItems()
-        for item in selected_items:
-            self.selected_methods_list.addItem(item.text())
-            self.available_methods_list.takeItem(self.available_methods_list.row(item))
+        self._move_model_rows(self.available_methods_list, self.selected_methods_list)
 
+    @profiled
     def move_to_available(self) -> None:
-        selected_items = self.selected_methods_list.selectedItems()
-        for item in selected_items:
-            self.available_methods_list.addItem(item.text())
-            self.selected_methods_list.takeItem(self.selected_methods_list.row(item))
+        self._move_model_rows(self.selected_methods_list, self.available_methods_list)
 
+    @profiled
     def move_feature_to_selected(self) -> None:
-        selected_items = self.feature_list.selectedItems()
-        for item in selected_items:
-            self.selected_feature_list.addItem(item.text())
-            self.feature_list.takeItem(self.feature_list.row(item))
+        self._move_model_rows(self.feature_list, self.selected_feature_list)
 
+    @profiled
     def move_feature_to_available(self) -> None:
-        selected_items = self.selected_feature_list.selectedItems()
-        for item in selected_items:
-            self.feature_list.addItem(item.text())
-            self.selected_feature_list.takeItem(self.selected_feature_list.row(item))
+        self._move_model_rows(self.selected_feature_list, self.feature_list)
 
     def get_selected_models(self) -> list:
-        selected_models = []
-        for i in range(self.selected_methods_list.count()):
-            item = self.selected_methods_list.item(i)
-            selected_models.append(item.text())
-        return selected_models
+        return self._selected_methods_model.stringList()
 
     def get_target_column(self) -> str:
         return self.target_combo.currentText()
 
     def get_feature_columns(self) -> list:
-        feature_columns = []
-        for i in range(self.selected_feature_list.count()):
-            item = self.selected_feature_list.item(i)
-            feature_columns.append(item.text())
-        return feature_columns
+        return self._selected_feature_model.stringList()
 
     def set_data_ready_signal(self, receiver) -> None:
+        # Drop any earlier connection to the same receiver so it runs once per emission
+        try:
+            self.data_ready_signal.disconnect(receiver)
+        except TypeError:
+            pass
         self.data_ready_signal.connect(receiver)
 
     def remove_feature(self) -> None:
-        selected_items = self.selected_feature_list.selectedItems()
-        for item in selected_items:
-            self.selected_feature_list.takeItem(self.selected_feature_list.row(item))
+        rows = {index.row() for index in self.selected_feature_list.selectionModel().selectedIndexes()}
+        if not rows:
+            return
 
+        with updates_suppressed(self.selected_feature_list):
+            self.selected_feature_list.selectionModel().clearSelection()
+            self._selected_feature_model.setStringList(
+                [text for row, text in enumerate(self._selected_feature_model.stringList()) if row not in rows]
+            )
+
+    @profiled
     def update_feature_columns(self) -> None:
         current_target = self.get_target_column()
+        if current_target == self.previous_target_column:
+            return
 
-        self.feature_list.clear()
-        columns = self.df.columns.tolist()
-
-        if current_target and current_target != "Select Target Column":
-            columns.remove(current_target)
-
-        self.feature_list.addItems(columns)
-
-        if self.previous_target_column and self.previous_target_column != "Select Target Column":
-            if self.previous_target_column in columns:
-                self.feature_list.addItem(self.previous_target_column)
+        # Only the old and new targets change places: remove and insert those two rows in the model instead of
+        # resetting it, which also keeps the user's selection in the available list
+        model = self._feature_model
+        rows = model.stringList()
+        previous = self.previous_target_column
+        with updates_suppressed(self.feature_list):
+            if current_target in self._column_positions and current_target in rows:
+                row = rows.index(current_target)
+                model.removeRows(row, 1)
+                del rows[row]
+            if (
+                previous in self._column_positions
+                and previous not in rows
+                and previous not in self._selected_feature_model.stringList()
+            ):
+                # Rows moved back from the selected list are appended at the end, so the list is not sorted by
+                # column position; put the old target before the first row that comes after it in the frame
+                position = self._column_positions[previous]
+                row = next(
+                    (i for i, column in enumerate(rows) if self._column_positions.get(column, -1) > position), len(rows)
+                )
+                model.insertRows(row, 1)
+                model.setData(model.index(row), previous)
 
         self.previous_target_column = current_target
 
+    @profiled
     def update_column_selection(self, df: pd.DataFrame) -> None:
-        columns = df.columns.tolist()
-        self.set_column_names(columns)
+        # Columns of the view's own DataFrame are cached by set_dataframe; other frames are read directly
+        columns = self._columns_cache if df is self.df else df.columns.tolist()
 
-        self.feature_list.clear()
-        self.feature_list.addItems(columns)
-
-        self.selected_feature_list.clear()
-        if self.previous_target_column in columns:
-            self.selected_feature_list.addItem(self.previous_target_column)
-        elif self.previous_target_column == "Select Target Column":
+        # Same columns as the widgets already show (e.g. a filtered or reloaded frame): keep the user's
+        # target and feature choices instead of rebuilding the combo and both lists
+        if tuple(columns) == self._shown_columns:
+            return
+        self._shown_columns = tuple(columns)
+
+        # Repopulate everything with painting and signals off, so the widgets lay out and repaint once
+        with updates_suppressed(self.feature_list, self.selected_feature_list, self.target_combo):
+            self.set_column_names(columns)
+            self._feature_model.setStringList(columns)
+            self._selected_feature_model.setStringList([])
+            # currentIndexChanged is blocked and the combo is back on its placeholder, so no column is the target
             self.previous_target_column = None
 
-    def set_dataframe(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def _hash_frame(df: pd.DataFrame) -> int:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        # Column names and dtypes are not part of the row hashes, so fold them in separately
+        return hash((tuple(df.columns), tuple(map(str, df.dtypes)), int(row_hashes.sum(dtype=np.uint64))))
+
+    def set_dataframe(self, df: pd.DataFrame, categorized: bool = False) -> None:
+        # Numeric columns are kept as given: runs read them from the float32 feature matrix. Frames from the CSV
+        # view were already categorized by its loader (categorized=True), so their strings are not rescanned.
+        if not categorized:
+            categorized_df = categorize_strings(df)
+            if categorized_df is not df:
+                before = df.memory_usage(deep=True).sum() / 1e6
+                after = categorized_df.memory_usage(deep=True).sum() / 1e6
+                self.logger.info(f"Stored repeated strings as categories: {before:.1f} MB -> {after:.1f} MB")
+            df = categorized_df
         self.df = df
+        self._columns_cache = list(df.columns)
+        self._column_positions = {column: i for i, column in enumerate(self._columns_cache)}
+
+        # Fingerprint the contents once here, so cache lookups on Run/Plot never rehash the rows. The same data
+        # arriving again (e.g. data_ready emitted twice) keeps the cached results and feature matrix.
+        df_hash = self._hash_frame(df)
+        if df_hash != self._df_hash:
+            self._df_hash = df_hash
+            self._results_cache.clear()
+            self._X_full = None
+            self._col_idx = {}
+
         self.update_column_selection(df)
 
+    def _build_feature_matrix(self) -> None:
+        from ml_backend.ml_backend import ALLOW_FP32
+
+        numeric_df = self.df.select_dtypes(include="number")
+        skipped_columns = [column for column in self.df.columns if column not in numeric_df.columns]
+        if skipped_columns:
+            self.logger.warning(f"Non-numeric columns kept out of the ML feature matrix: {skipped_columns}")
+        self._X_full = numeric_df.to_numpy(dtype=np.float32 if ALLOW_FP32 else np.float64, na_value=np.nan)
+        self._col_idx = {column: i for i, column in enumerate(numeric_df.columns)}
+
+    def _training_row_count(self) -> int:
+        max_rows = self.sample_spin.value()
+        return min(max_rows, len(self.df)) if max_rows else len(self.df)
+
+    def _prepare_xy(self, target_column: str, feature_columns: list, rows: np.ndarray | None = None):
+        # Slice the cached matrix into C-contiguous arrays in the estimators' dtype, so the backend's own
+        # ascontiguousarray is a no-op and the arrays pickle to the worker processes without another copy
+        idx = np.fromiter((self._col_idx[column] for column in feature_columns), dtype=np.intp)
+        target_idx = self._col_idx[target_column]
+        if rows is None:
+            X = self._X_full[:, idx]
+            y = self._X_full[:, target_idx]
+        else:
+            X = self._X_full[np.ix_(rows, idx)]
+            y = self._X_full[rows, target_idx]
+        return np.ascontiguousarray(X), np.ascontiguousarray(y)
+
+    def _ml_job(self, target_column: str, feature_columns: list, models: list):
+        """Build the backend call for a run on the GUI thread, so the worker never touches MLView state."""
+        # Imported here so scikit-learn is only loaded once the user actually runs a model
+        from ml_backend.ml_backend import run_ml_methods, run_ml_methods_xy
+
+        if self._X_full is None:
+            self._build_feature_matrix()
+
+        # Fixed seed, so a plot after a run trains on the same sample and can reuse its results
+        n_rows = len(self.df)
+        n_used = self._training_row_count()
+        rows = None if n_used == n_rows else np.sort(np.random.default_rng(0).choice(n_rows, n_used, replace=False))
+
+        # A single method is fitted on the worker thread: the pool's process startup would buy no parallelism
+        backend_options = {"cache_dir": self.result_cache_dir}
+        if len(models) > 1:
+            backend_options.update(executor=self._process_pool(), max_concurrency=MAX_FIT_PROCESSES)
+
+        if target_column not in self._col_idx or any(column not in self._col_idx for column in feature_columns):
+            # Non-numeric columns are not in the dense matrix; let the backend work from the DataFrame
+            df = self.df if rows is None else self.df.iloc[rows]
+            return partial(run_ml_methods, df, target_column, feature_columns, models, **backend_options)
+
+        X, y = self._prepare_xy(target_column, feature_columns, rows)
+        return partial(run_ml_methods_xy, X, y, models, **backend_options)
+
+    @profiled
     def run_ml_methods_clicked(self) -> None:
         target_column = self.get_target_column()
         feature_columns = self.get_feature_columns()
@@ -283,69 +555,138 @@ class MLView(QWidget):
             QMessageBox.warning(self, "Warning", "Please load a CSV file.")
             return
 
-        try:
-            results = run_ml_methods(self.df, target_column, feature_columns, selected_models)
-
-            self.logger.info("ML methods executed successfully.")
-
-            best_method = max(results.keys(), key=lambda m: results[m].get("cv_mean_score", 0))
-            best_result = results[best_method]
-
-            result_str = (
-                f"Best Method: {best_method}\n"
-                f"  CV Mean Score: {best_result['cv_mean_score']:.4f}\n"
-                f"  CV Std Score: {best_result['cv_std_score']:.4f}\n"
-                f"  Train MSE: {best_result.get('train_mse', 'N/A'):.4f}\n"
-                f"  Test MSE: {best_result.get('test_mse', 'N/A'):.4f}\n"
-                f"  Train R2: {best_result.get('train_r2', 'N/A'):.4f}\n"
-                f"  Test R2: {best_result.get('test_r2', 'N/A'):.4f}\n"
-                f"  Best Hyperparameters: {best_result.get('best_hyperparameters', 'N/A')}\n"
-            )
+        key = (self._df_hash, target_column, tuple(feature_columns), self._training_row_count())
+        self._get_results(key, selected_models, partial(self._on_ml_done, key))
 
-            msg_box = QMessageBox(self)
-            msg_box.setIcon(QMessageBox.Information)
-            msg_box.setWindowTitle("Best ML Method Result")
-            msg_box.setText(result_str)
+    def _get_results(self, key: tuple, methods: list, on_done) -> None:
+        """Pass the results for methods to on_done, fitting only the ones not cached under key."""
+        cached = self._results_cache.setdefault(key, {})
+        missing = [m for m in methods if m not in cached]
+        if not missing:
+            on_done({m: cached[m] for m in methods})
+            return
 
-            close_button = msg_box.addButton("Close", QMessageBox.RejectRole)  # noqa
-            save_button = msg_box.addButton("Save All Results", QMessageBox.ActionRole)
-            msg_box.exec_()
+        if self._ml_worker is not None:
+            return
 
-            if msg_box.clickedButton() == save_button:
-                filename, _ = QFileDialog.getSaveFileName(self, "Save Results", "", "JSON Files (*.json)")
-                if filename:
-                    download_results_as_json(results, filename)
-                    self.logger.info(f"Results saved to {filename}")
+        _, target_column, feature_columns, _ = key
+        self._start_worker(
+            self._ml_job(target_column, list(feature_columns), missing),
+            partial(self._on_results_ready, key, methods, on_done),
+        )
 
+    def _on_results_ready(self, key: tuple, methods: list, on_done, results: dict) -> None:
+        cached = self._results_cache.setdefault(key, {})
+        cached.update(results)
+        # Unknown models are skipped by the backend, so they may be missing from the results
+        on_done({m: cached[m] for m in methods if m in cached})
+
+    def _start_worker(self, job, on_result) -> None:
+        self.run_ml_button.setEnabled(False)
+        self.plot_results_button.setEnabled(False)
+        self.setCursor(Qt.BusyCursor)
+
+        # Kept on self so its signals object outlives the run; also marks a job as in flight
+        self._ml_worker = MLWorker(job)
+        self._ml_worker.signals.result_ready.connect(on_result)
+        self._ml_worker.signals.error.connect(self._on_ml_error)
+        self._ml_worker.signals.finished.connect(self._on_ml_finished)
+        self._thread_pool.start(self._ml_worker)
+
+    def _on_ml_finished(self) -> None:
+        self._ml_worker = None
+        self.run_ml_button.setEnabled(True)
+        self.plot_results_button.setEnabled(True)
+        self.unsetCursor()
+
+    def _on_ml_error(self, message: str) -> None:
+        QMessageBox.critical(self, "Error", f"Error running ML methods: {message}")
+
+    def _on_ml_done(self, key: tuple, results: dict) -> None:
+        self.logger.info("ML methods executed successfully.")
+
+        try:
+            self._best_method, best_result = max(results.items(), key=lambda item: item[1].get("cv_mean_score", 0))
+            self._show_results_dialog(key, results, best_result)
         except Exception as e:
             self.logger.error(f"Error running ML methods: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Error running ML methods: {e}")
 
+    @staticmethod
+    def _format_value(value) -> str:
+        # isinstance instead of try/except around the format; missing metrics show as "N/A"
+        return f"{value:.4f}" if isinstance(value, (int, float)) else str(value)
+
+    @staticmethod
+    def _format_result_string(method: str, result: dict) -> str:
+        lines = [f"Best Method: {method}"]
+        lines.extend(f"  {label}: {MLView._format_value(result.get(key, 'N/A'))}" for label, key in RESULT_METRICS)
+        lines.append(f"  Best Hyperparameters: {result.get('best_hyperparameters', 'N/A')}")
+        return "\n".join(lines) + "\n"
+
+    def _show_results_dialog(self, key: tuple, results: dict, best_result: dict) -> None:
+        result_str = self._format_result_string(self._best_method, best_result)
+        rows_used = key[-1]
+        if rows_used < len(self.df):
+            result_str += f"\nTrained on a sample of {rows_used} of {len(self.df)} rows.\n"
+
+        if self._result_box is None:
+            self._result_box = QMessageBox(self)
+            self._result_box.setIcon(QMessageBox.Information)
+            self._result_box.setWindowTitle("Best ML Method Result")
+            self._result_box.addButton("Close", QMessageBox.RejectRole)
+            self._result_save_button = self._result_box.addButton("Save All Results", QMessageBox.ActionRole)
+
+        self._result_box.setText(result_str)
+        self._result_box.exec_()
+
+        if self._result_box.clickedButton() == self._result_save_button:
+            filename, _ = QFileDialog.getSaveFileName(self, "Save Results", "", "JSON Files (*.json)")
+            if filename:
+                from ml_backend.ml_backend import download_results_as_json
+
+                download_results_as_json(results, filename)
+                self.logger.info(f"Results saved to {filename}")
+
     def plot_results_clicked(self) -> None:
         selected_methods = self.get_selected_models()
         if not selected_methods:
             QMessageBox.warning(self, "Warning", "No ML methods available for plotting.")
             return
 
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Select Method to Plot")
+        if self._plot_select_dialog is None:
+            self._build_plot_select_dialog()
 
-        layout = QVBoxLayout()
-        checkboxes = {}
+        # Only add or remove the checkboxes whose methods changed since the dialog was last shown
+        for method in set(self._plot_checkboxes) - set(selected_methods):
+            checkbox = self._plot_checkboxes.pop(method)
+            self._plot_checkbox_layout.removeWidget(checkbox)
+            checkbox.deleteLater()
         for method in selected_methods:
-            checkbox = QCheckBox(method)
-            layout.addWidget(checkbox)
-            checkboxes[method] = checkbox
+            if method not in self._plot_checkboxes:
+                checkbox = QCheckBox(method)
+                self._plot_checkbox_layout.addWidget(checkbox)
+                self._plot_checkboxes[method] = checkbox
+        self._plot_methods = selected_methods
+
+        self._plot_select_dialog.exec_()
+
+    def _build_plot_select_dialog(self) -> None:
+        self._plot_select_dialog = QDialog(self)
+        self._plot_select_dialog.setWindowTitle("Select Method to Plot")
+
+        layout = QVBoxLayout()
+        self._plot_checkbox_layout = QVBoxLayout()
+        layout.addLayout(self._plot_checkbox_layout)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(
-            lambda: self.plot_selected_methods([m for m, cb in checkboxes.items() if cb.isChecked()])
+            lambda: self.plot_selected_methods([m for m in self._plot_methods if self._plot_checkboxes[m].isChecked()])
         )
-        button_box.rejected.connect(dialog.reject)
+        button_box.rejected.connect(self._plot_select_dialog.reject)
 
         layout.addWidget(button_box)
-        dialog.setLayout(layout)
-        dialog.exec_()
+        self._plot_select_dialog.setLayout(layout)
 
     def plot_selected_methods(self, methods: list) -> None:
         if not methods:
@@ -357,25 +698,121 @@ class MLView(QWidget):
             QMessageBox.warning(self, "Warning", "No target column selected.")
             return
 
-        results = run_ml_methods(self.df, target_column, self.get_feature_columns(), methods)
+        feature_columns = self.get_feature_columns()
+        key = (self._df_hash, target_column, tuple(feature_columns), self._training_row_count())
+        self._get_results(key, methods, partial(self._plot_results, methods))
 
+    def _plot_results(self, methods: list, results: dict) -> None:
+        plots = []
         for method in methods:
             result = results.get(method, {})
-            test_predictions = result.get("test_predictions", [])
-            test_actuals = result.get("y_test", [])
+            # Convert the backend's lists once so matplotlib works on contiguous arrays from here on
+            test_predictions = np.asarray(result.get("test_predictions", []), dtype=np.float32)
+            test_actuals = np.asarray(result.get("y_test", []), dtype=np.float32)
 
-            if len(test_predictions) != len(test_actuals):
+            if test_predictions.shape != test_actuals.shape:
                 QMessageBox.warning(self, "Warning", f"Prediction length mismatch for {method}.")
                 continue
 
-            if not test_predictions:
+            if not test_predictions.size:
                 QMessageBox.warning(self, "Warning", f"No predictions available for {method}.")
                 continue
 
-            plt.figure()
-            plt.scatter(test_actuals, test_predictions, alpha=0.7, label="Predictions")
-            plt.xlabel("Actual Values")
-            plt.ylabel("Predicted Values")
-            plt.title(f"{method} - Actual vs Predicted")
-            plt.grid(True)
-            plt.show()
+            plots.append((method, test_actuals, test_predictions))
+
+        if not plots:
+            return
+
+        # One grid for the whole selection, with the per-method plots laid out near-square
+        nrows = math.ceil(math.sqrt(len(plots)))
+        ncols = math.ceil(len(plots) / nrows)
+
+        large = max(actuals.size for _, actuals, _ in plots) > LARGE_SCATTER_THRESHOLD
+        if large and self._plot_with_pyqtgraph(plots, ncols):
+            return
+
+        self._ensure_plot_canvas()
+
+        self._plot_fig.clear()
+        axes = self._plot_fig.subplots(nrows, ncols, squeeze=False).ravel()
+        for ax, (method, test_actuals, test_predictions) in zip(axes, plots):
+            self._create_scatter_plot(ax, method, test_actuals, test_predictions)
+        for ax in axes[len(plots) :]:
+            ax.set_visible(False)
+        self._plot_fig.tight_layout()
+        self._plot_canvas.draw_idle()
+
+        self._plot_dialog.resize(min(450 * ncols, 1400), min(350 * nrows, 1000))
+        self._plot_dialog.exec_()
+
+    def _plot_with_pyqtgraph(self, plots: list, ncols: int) -> bool:
+        # Optional: pyqtgraph draws large scatters through QGraphicsScene much faster than Agg can rasterize them
+        try:
+            import pyqtgraph as pg
+        except ImportError:
+            return False
+
+        if self._pg_dialog is None:
+            self._pg_layout = pg.GraphicsLayoutWidget()
+            self._pg_dialog = QDialog(self)
+            self._pg_dialog.setWindowTitle("Actual vs Predicted")
+            layout = QVBoxLayout()
+            layout.addWidget(self._pg_layout)
+            self._pg_dialog.setLayout(layout)
+            self._pg_dialog.finished.connect(self._pg_layout.clear)
+
+        self._pg_layout.clear()
+        for i, (method, test_actuals, test_predictions) in enumerate(plots):
+            plot = self._pg_layout.addPlot(row=i // ncols, col=i % ncols, title=f"{method} - Actual vs Predicted")
+            plot.setLabel("bottom", "Actual Values")
+            plot.setLabel("left", "Predicted Values")
+            plot.showGrid(x=True, y=True)
+            scatter = pg.ScatterPlotItem(x=test_actuals, y=test_predictions, pen=None, brush=(0, 0, 255, 128), size=5)
+            plot.addItem(scatter)
+
+        nrows = math.ceil(len(plots) / ncols)
+        self._pg_dialog.resize(min(450 * ncols, 1400), min(350 * nrows, 1000))
+        self._pg_dialog.exec_()
+        return True
+
+    def _ensure_plot_canvas(self) -> None:
+        if self._plot_canvas is not None:
+            return
+
+        # Imported here so matplotlib's backend and font cache are only loaded once the user plots
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
+        from matplotlib.figure import Figure
+
+        self._plot_fig = Figure()
+        self._plot_canvas = FigureCanvasQTAgg(self._plot_fig)
+
+        self._plot_dialog = QDialog(self)
+        self._plot_dialog.setWindowTitle("Actual vs Predicted")
+        layout = QVBoxLayout()
+        layout.addWidget(NavigationToolbar2QT(self._plot_canvas, self._plot_dialog))
+        layout.addWidget(self._plot_canvas)
+        self._plot_dialog.setLayout(layout)
+
+        # Release the plotted artists once the dialog is closed
+        self._plot_dialog.finished.connect(self._plot_fig.clear)
+
+    @staticmethod
+    def _create_scatter_plot(ax, method: str, test_actuals: np.ndarray, test_predictions: np.ndarray) -> None:
+        if test_actuals.size > LARGE_SCATTER_THRESHOLD:
+            ax.plot(
+                test_actuals,
+                test_predictions,
+                linestyle="none",
+                marker="o",
+                markersize=3,
+                alpha=0.7,
+                label="Predictions",
+                # Saved figures embed the markers as one bitmap instead of a vector path per point
+                rasterized=True,
+            )
+        else:
+            ax.scatter(test_actuals, test_predictions, alpha=0.7, label="Predictions")
+        ax.set_xlabel("Actual Values")
+        ax.set_ylabel("Predicted Values")
+        ax.set_title(f"{method} - Actual vs Predicted")
+        ax.grid(True)
@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.markers import MarkerStyle
+from pandas.api.types import is_numeric_dtype
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import (
@@ -15,8 +17,37 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
 )
 
+from utils.gui_utils import updates_suppressed
 from utils.plotting_utils import AxesOptionsDialog, LineFitOptionsDialog, MarkerOptionsDialog
 
+# Columns this long are plotted as float32: still far finer than a pixel, at half the bytes per redraw
+LARGE_COLUMN_THRESHOLD = 10_000
+
+
+def _centered_stats(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float, float, float]:
+    # Means plus centered sums of squares and cross products, all a straight-line fit and its R² need. Shifting by
+    # the first point before centering keeps offset data (timestamps, 1e8 ± 1) from cancelling, and makes a constant
+    # column centre to exact zeros.
+    dx = x.astype(np.float64) - float(x[0])
+    dy = y.astype(np.float64) - float(y[0])
+    shift_x = dx.mean()
+    shift_y = dy.mean()
+    dx -= shift_x
+    dy -= shift_y
+    return float(x[0]) + shift_x, float(y[0]) + shift_y, dx @ dx, dy @ dy, dx @ dy
+
+
+def linear_fit(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
+    # Closed-form least squares returning (slope, intercept, R²), instead of polyfit's Vandermonde + SVD
+    mean_x, mean_y, ss_xx, ss_yy, ss_xy = _centered_stats(x, y)
+    slope = ss_xy / ss_xx if ss_xx > 0 else 0.0
+    intercept = mean_y - slope * mean_x
+
+    # With centered sums the residual is only off by rounding, which can leave it a hair below zero
+    ss_res = max(ss_yy - slope * ss_xy, 0.0)
+    r_squared = 1 - ss_res / ss_yy if ss_yy > 0 else 0
+    return float(slope), float(intercept), float(r_squared)
+
 
 class PlottingWidget(QDialog):
     current_plot: plt.Figure | None = None
@@ -31,13 +62,29 @@ class PlottingWidget(QDialog):
         self.original_xlim = None
         self.original_ylim = None
 
+        # Per-column arrays and per-(x, y) masked arrays and fits, valid until update_data swaps the frame
+        self._column_arrays: dict[str, np.ndarray] = {}
+        self._pair_arrays: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+        self._fit_cache: dict[tuple[str, str], tuple[float, float, float]] = {}
+
+        # Artists of the current plot, restyled in place by update_plot instead of clearing the figure
+        self._ax: plt.Axes | None = None
+        self._plotted_columns: tuple[str, str] | None = None
+        self._scatter = None
+        self._trend_line = None
+        self._r_squared_text = None
+        # Everything the last redraw depended on, so no-op option applies can return early
+        self._last_state: tuple | None = None
+
         self.layout = QVBoxLayout()
 
         self.x_combo = QComboBox()
         self.y_combo = QComboBox()
 
-        self.x_combo.addItems(self.df.columns)
-        self.y_combo.addItems(self.df.columns)
+        # Column names currently listed in the combos, so update_data can tell a schema change from new rows
+        self._columns: list = list(self.df.columns)
+        self.x_combo.addItems(self._columns)
+        self.y_combo.addItems(self._columns)
 
         self.layout.addWidget(QLabel("Select X Data:"))
         self.layout.addWidget(self.x_combo)
@@ -79,19 +126,37 @@ class PlottingWidget(QDialog):
 
         self.setLayout(self.layout)
 
-        self.marker_options_dialog = MarkerOptionsDialog(self)
-        self.line_fit_options_dialog = LineFitOptionsDialog(self)
-        self.axes_options_dialog = AxesOptionsDialog(self)
-
-        self.axes_options_dialog.options_applied.connect(self.update_axes_options)
-        self.marker_options_dialog.options_applied.connect(self.update_plot)
-        self.line_fit_options_dialog.options_applied.connect(self.update_plot)
+        # Option dialogs are built on first use (opening one, or the first plot), not with every widget
+        self._marker_options_dialog: MarkerOptionsDialog | None = None
+        self._line_fit_options_dialog: LineFitOptionsDialog | None = None
+        self._axes_options_dialog: AxesOptionsDialog | None = None
 
         self.x_title = "X Axis"
         self.y_title = "Y Axis"
         self.title_size = 12
         self.tick_size = 10
 
+    @property
+    def marker_options_dialog(self) -> MarkerOptionsDialog:
+        if self._marker_options_dialog is None:
+            self._marker_options_dialog = MarkerOptionsDialog(self)
+            self._marker_options_dialog.options_applied.connect(self.update_plot)
+        return self._marker_options_dialog
+
+    @property
+    def line_fit_options_dialog(self) -> LineFitOptionsDialog:
+        if self._line_fit_options_dialog is None:
+            self._line_fit_options_dialog = LineFitOptionsDialog(self)
+            self._line_fit_options_dialog.options_applied.connect(self.update_plot)
+        return self._line_fit_options_dialog
+
+    @property
+    def axes_options_dialog(self) -> AxesOptionsDialog:
+        if self._axes_options_dialog is None:
+            self._axes_options_dialog = AxesOptionsDialog(self)
+            self._axes_options_dialog.options_applied.connect(self.update_axes_options)
+        return self._axes_options_dialog
+
     def open_marker_options_dialog(self) -> None:
         self.marker_options_dialog.exec_()
 
@@ -116,6 +181,10 @@ class PlottingWidget(QDialog):
             self.show_warning_message("Invalid Data", "X and Y data cannot be the same.")
             return
 
+        if not (self._is_numeric(self.x_combo.currentText()) and self._is_numeric(self.y_combo.currentText())):
+            self.show_warning_message("Invalid Data", "X and Y data must be numeric.")
+            return
+
         PlottingWidget.current_plot = plt.figure()
         self.update_plot()
 
@@ -125,76 +194,160 @@ class PlottingWidget(QDialog):
         self.cis_button_press = plt.gcf().canvas.mpl_connect("button_press_event", self.on_button_press)
 
     def update_plot(self) -> None:
-        plt.clf()
-
         x_column: str = self.x_combo.currentText()
         y_column: str = self.y_combo.currentText()
 
-        x = self.df[x_column].values
-        y = self.df[y_column].values
-
-        if len(x) > 1:
-            mean_y = np.mean(y)
-            ss_tot = np.sum((y - mean_y) ** 2)
-            if self.line_fit_options_dialog.r_squared_checkbox.isChecked():
-                z = np.polyfit(x, y, 1)
-                p = np.poly1d(z)
-                ss_res = np.sum((y - p(x)) ** 2)
-                r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-            else:
-                ss_res = np.sum((y - mean_y) ** 2)
-                r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        else:
-            r_squared = 0
-
-        plt.scatter(
-            x,
-            y,
-            marker=self.marker_options_dialog.get_marker_symbol(),
-            s=self.marker_options_dialog.marker_size_slider.value(),
-            color=self.marker_options_dialog.marker_color.name()
-            if isinstance(self.marker_options_dialog.marker_color, QColor)
-            else "red",
-        )
-
-        if self.line_fit_options_dialog.line_fit_checkbox.isChecked():
-            z = np.polyfit(x, y, 1)
-            p = np.poly1d(z)
-            plt.plot(
-                x,
-                p(x),
-                color=self.line_fit_options_dialog.line_fit_color.name()
-                if isinstance(self.line_fit_options_dialog.line_fit_color, QColor)
-                else "black",
-                linewidth=self.line_fit_options_dialog.line_thickness_slider.value(),
-                linestyle=self.get_line_style(),
-            )
+        if not (self._is_numeric(x_column) and self._is_numeric(y_column)):
+            return
 
-        if self.line_fit_options_dialog.r_squared_checkbox.isChecked():
-            plt.text(0.1, 0.9, f"R² = {r_squared:.2f}", transform=plt.gca().transAxes)
+        marker_dialog = self.marker_options_dialog
+        line_dialog = self.line_fit_options_dialog
+        show_line = line_dialog.line_fit_checkbox.isChecked()
+        show_r_squared = line_dialog.r_squared_checkbox.isChecked()
+        marker = marker_dialog.get_marker_symbol()
+        marker_size = marker_dialog.marker_size_slider.value()
+        marker_color = marker_dialog.marker_color.name() if isinstance(marker_dialog.marker_color, QColor) else "red"
+        line_color = line_dialog.line_fit_color.name() if isinstance(line_dialog.line_fit_color, QColor) else "black"
+        line_width = line_dialog.line_thickness_slider.value()
+        line_style = line_dialog.get_line_style()
 
-        plt.xlabel(self.x_title, fontsize=self.title_size)
-        plt.ylabel(self.y_title, fontsize=self.title_size)
-        plt.tick_params(axis="both", which="major", labelsize=self.tick_size)
+        ax = plt.gca()
+        state = (
+            ax,
+            x_column,
+            y_column,
+            show_line,
+            show_r_squared,
+            marker,
+            marker_size,
+            marker_color,
+            line_color,
+            line_width,
+            line_style,
+            self.x_title,
+            self.y_title,
+            self.title_size,
+            self.tick_size,
+        )
+        if state == self._last_state:
+            # The dialogs emit options_applied even when nothing was changed; there is nothing to redraw
+            return
+        self._last_state = state
+
+        x, y = self._plot_arrays(x_column, y_column)
+
+        # Fit once per column pair; the trend line and R² share it and style-only redraws skip it
+        fit = None
+        if len(x) > 1 and (show_line or show_r_squared):
+            fit = self._fit_cache.get((x_column, y_column))
+            if fit is None:
+                fit = self._fit_cache[(x_column, y_column)] = linear_fit(x, y)
+
+        r_squared = fit[2] if show_r_squared and fit is not None else 0
+
+        if ax is not self._ax:
+            # New figure: its axes start empty, so every artist has to be created again
+            self._ax = ax
+            self._plotted_columns = None
+            self._scatter = self._trend_line = self._r_squared_text = None
+        columns_changed = (x_column, y_column) != self._plotted_columns
+        self._plotted_columns = (x_column, y_column)
+
+        if self._scatter is None:
+            self._scatter = ax.scatter(x, y, marker=marker, s=marker_size, color=marker_color)
+            rescale = False
+        else:
+            # Reuse the collection: new columns only swap its offsets, option changes only restyle it
+            if columns_changed:
+                self._scatter.set_offsets(np.column_stack((x, y)))
+            marker_style = MarkerStyle(marker)
+            self._scatter.set_paths([marker_style.get_path().transformed(marker_style.get_transform())])
+            self._scatter.set_sizes([marker_size])
+            self._scatter.set_color(marker_color)
+            rescale = columns_changed
+
+        if show_line and fit is not None:
+            slope, intercept, _ = fit
+            if self._trend_line is None or columns_changed:
+                # A straight line only needs its two end points, not one vertex per (unsorted) sample
+                line_x = np.array([x.min(), x.max()])
+                if self._trend_line is None:
+                    (self._trend_line,) = ax.plot(line_x, slope * line_x + intercept)
+                else:
+                    self._trend_line.set_data(line_x, slope * line_x + intercept)
+            self._trend_line.set_color(line_color)
+            self._trend_line.set_linewidth(line_width)
+            self._trend_line.set_linestyle(line_style)
+        elif self._trend_line is not None:
+            self._trend_line.remove()
+            self._trend_line = None
+
+        if rescale:
+            # Artists updated in place don't move the data limits, so recompute them for the new columns
+            ax.set_autoscale_on(True)
+            ax.ignore_existing_data_limits = True
+            ax.update_datalim(self._scatter.get_offsets())
+            if self._trend_line is not None:
+                ax.update_datalim(np.column_stack(self._trend_line.get_data()))
+            ax.autoscale_view()
+
+        if show_r_squared:
+            if self._r_squared_text is None:
+                self._r_squared_text = ax.text(0.1, 0.9, "", transform=ax.transAxes)
+            self._r_squared_text.set_text(f"R² = {r_squared:.2f}")
+        elif self._r_squared_text is not None:
+            self._r_squared_text.remove()
+            self._r_squared_text = None
+
+        ax.set_xlabel(self.x_title, fontsize=self.title_size)
+        ax.set_ylabel(self.y_title, fontsize=self.title_size)
+        ax.tick_params(axis="both", which="major", labelsize=self.tick_size)
         plt.draw()
 
+    def _is_numeric(self, column: str) -> bool:
+        return column in self.df.columns and is_numeric_dtype(self.df[column])
+
+    def _column_array(self, column: str) -> np.ndarray:
+        array = self._column_arrays.get(column)
+        if array is None:
+            # Convert once to a contiguous float array (missing values as NaN) so redraws never re-validate dtypes
+            dtype = np.float32 if len(self.df) >= LARGE_COLUMN_THRESHOLD else np.float64
+            array = self._column_arrays[column] = np.ascontiguousarray(
+                self.df[column].to_numpy(dtype=dtype, na_value=np.nan)
+            )
+        return array
+
+    def _plot_arrays(self, x_column: str, y_column: str) -> tuple[np.ndarray, np.ndarray]:
+        arrays = self._pair_arrays.get((x_column, y_column))
+        if arrays is None:
+            x = self._column_array(x_column)
+            y = self._column_array(y_column)
+            # Drop rows missing either value once, so the fit sees finite data and matplotlib has nothing to skip
+            valid = ~(np.isnan(x) | np.isnan(y))
+            arrays = self._pair_arrays[(x_column, y_column)] = (x, y) if valid.all() else (x[valid], y[valid])
+        return arrays
+
     def update_data(self, df: pd.DataFrame) -> None:
         self.df = df
-        self.x_combo.clear()
-        self.y_combo.clear()
-        self.x_combo.addItems(self.df.columns)
-        self.y_combo.addItems(self.df.columns)
+        self._column_arrays.clear()
+        self._pair_arrays.clear()
+        self._fit_cache.clear()
+        self._plotted_columns = None
+        self._last_state = None
+
+        columns = list(df.columns)
+        if columns == self._columns:
+            # Same columns (e.g. after an impute): keep the user's x/y selection and skip rebuilding the combos
+            return
+        self._columns = columns
+        with updates_suppressed(self.x_combo, self.y_combo):
+            self.x_combo.clear()
+            self.y_combo.clear()
+            self.x_combo.addItems(columns)
+            self.y_combo.addItems(columns)
 
     def get_line_style(self) -> str:
-        line_type: str = self.line_fit_options_dialog.line_type_combo.currentText()
-        if line_type == "Dashed":
-            return "--"
-        elif line_type == "Dotted":
-            return ":"
-        elif line_type == "DashDot":
-            return "-."
-        else:
-            return "-"
+        return self.line_fit_options_dialog.get_line_style()
 
     def show_warning_message(self, title: str, message: str) -> None:
         msg_box = QMessageBox(self)
@@ -205,9 +358,9 @@ class PlottingWidget(QDialog):
         msg_box.exec_()
 
     def on_scroll(self, event) -> None:
-        ax = plt.gca()
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
+        ax = event.inaxes or plt.gca()
+        xlim = np.asarray(ax.get_xlim())
+        ylim = np.asarray(ax.get_ylim())
 
         if event.button == "up":
             scale_factor = 1 / self.zoom_factor
@@ -216,20 +369,22 @@ class PlottingWidget(QDialog):
         else:
             scale_factor = 1
 
-        new_xlim = [x + (x - xlim[0]) * (1 - scale_factor) for x in xlim]
-        new_ylim = [y + (y - ylim[0]) * (1 - scale_factor) for y in ylim]
-
-        ax.set_xlim(new_xlim)
-        ax.set_ylim(new_ylim)
+        # Scale both limits about the cursor so the point under it stays put; fall back to the view centre
+        center_x = event.xdata if event.xdata is not None else xlim.mean()
+        center_y = event.ydata if event.ydata is not None else ylim.mean()
+        ax.set_xlim(center_x + (xlim - center_x) * scale_factor)
+        ax.set_ylim(center_y + (ylim - center_y) * scale_factor)
 
-        plt.draw()
+        # Zooming changes ticks and labels, so a blitted background would go stale; instead let the canvas
+        # coalesce a burst of wheel events into a single repaint
+        event.canvas.draw_idle()
 
     def on_button_press(self, event) -> None:
         if event.button == 3:
             if self.original_xlim is not None and self.original_ylim is not None:
                 plt.gca().set_xlim(self.original_xlim)
                 plt.gca().set_ylim(self.original_ylim)
-                plt.draw()
+                event.canvas.draw_idle()
         else:
             self.original_xlim = plt.gca().get_xlim()
             self.original_ylim = plt.gca().get_ylim()
@@ -1,16 +1,35 @@
+import hashlib
 import json
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import Executor
+from types import MappingProxyType
 
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import AdaBoostRegressor, GradientBoostingRegressor, RandomForestRegressor
 from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+from sklearn.experimental import enable_halving_search_cv  # noqa
 from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.model_selection import GridSearchCV, train_test_split
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV, ParameterGrid, train_test_split
 from sklearn.neural_network import MLPRegressor
 from sklearn.svm import SVR
 from sklearn.tree import DecisionTreeRegressor
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+logger = logging.getLogger("MLBackend")
+
+# Leading spaces of each line; JSON strings never contain a raw newline, so this only matches indentation
+_INDENT_RE = re.compile(rb"^( +)", re.MULTILINE)
+
 # Mapping of model names to their scikit-learn classes and their hyperparameters for grid search
-MODEL_MAPPING = {
+_MODEL_MAPPING = {
     "Linear Regression": (LinearRegression, {}),
     "Ridge Regression": (Ridge, {"alpha": [0.1, 1.0, 10.0]}),
     "Lasso Regression": (Lasso, {"alpha": [0.1, 1.0, 10.0]}),
@@ -60,52 +79,226 @@ MODEL_MAPPING = {
     ),
 }
 
+# Exposed read-only so callers can share the mapping directly instead of taking defensive copies
+MODEL_MAPPING = MappingProxyType(_MODEL_MAPPING)
 
-def run_ml_methods(df: pd.DataFrame, target_column: str, feature_columns: list, selected_models: list):
-    X = df[feature_columns]
-    y = df[target_column]
+# Feed estimators contiguous float32 arrays: halves the bytes streamed through every fit/predict
+ALLOW_FP32 = True
 
-    # Split the data
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+# Estimators that convert their input to float64 internally (libsvm), so a float32 copy only adds work
+FP64_MODELS = frozenset({"Support Vector Machines"})
 
-    results = {}
+CV_FOLDS = 5
 
-    for model_name in selected_models:
-        model_class, param_grid = MODEL_MAPPING.get(model_name, (None, None))
-        if model_class is None:
-            continue
+# Successive halving: every candidate is scored on a small sample and only the best 1/HALVING_FACTOR move on to
+# HALVING_FACTOR times more data. Below HALVING_MIN_SAMPLES training rows the budgets get too small to rank
+# candidates (and halving needs at least 2 * CV_FOLDS rows), so the exhaustive search is used instead.
+HALVING_FACTOR = 3
+HALVING_MIN_SAMPLES = 2 * CV_FOLDS * HALVING_FACTOR
 
-        model = model_class()
+# Most entries kept in a result cache directory; the least recently used ones are removed past this
+RESULT_CACHE_MAX_ENTRIES = 256
 
-        # Hyperparameter search with 5-fold cross-validation
-        grid_search = GridSearchCV(model, param_grid, cv=5, scoring="neg_mean_squared_error", n_jobs=-1)
-        grid_search.fit(X_train, y_train)
 
-        best_model = grid_search.best_estimator_
+def _make_search(model, param_grid: dict, n_samples: int, n_jobs: int):
+    if len(ParameterGrid(param_grid)) > 1 and n_samples >= HALVING_MIN_SAMPLES:
+        return HalvingGridSearchCV(
+            model,
+            param_grid,
+            cv=CV_FOLDS,
+            factor=HALVING_FACTOR,
+            scoring="neg_mean_squared_error",
+            n_jobs=n_jobs,
+            random_state=42,
+        )
+    return GridSearchCV(model, param_grid, cv=CV_FOLDS, scoring="neg_mean_squared_error", n_jobs=n_jobs)
 
-        # Predict and evaluate
-        train_predictions = best_model.predict(X_train)
-        test_predictions = best_model.predict(X_test)
 
-        metrics = {
-            "train_mse": mean_squared_error(y_train, train_predictions),
-            "test_mse": mean_squared_error(y_test, test_predictions),
-            "train_r2": r2_score(y_train, train_predictions),
-            "test_r2": r2_score(y_test, test_predictions),
-        }
+def _fit_model(model_name: str, X_train, X_test, y_train, y_test, n_jobs: int = -1) -> dict:
+    model_class, param_grid = MODEL_MAPPING[model_name]
+    model = model_class()
+
+    # Hyperparameter search with 5-fold cross-validation
+    grid_search = _make_search(model, param_grid, len(y_train), n_jobs)
+    grid_search.fit(X_train, y_train)
+
+    best_model = grid_search.best_estimator_
+
+    # Predict and evaluate
+    train_predictions = best_model.predict(X_train)
+    test_predictions = best_model.predict(X_test)
+
+    # Cast to Python floats so float32 metrics stay JSON serializable
+    metrics = {
+        "train_mse": float(mean_squared_error(y_train, train_predictions)),
+        "test_mse": float(mean_squared_error(y_test, test_predictions)),
+        "train_r2": float(r2_score(y_train, train_predictions)),
+        "test_r2": float(r2_score(y_test, test_predictions)),
+    }
+
+    return {
+        "best_hyperparameters": grid_search.best_params_,
+        "cv_mean_score": float(-grid_search.best_score_),
+        "cv_std_score": float(grid_search.cv_results_["std_test_score"][grid_search.best_index_]),
+        "test_predictions": test_predictions.tolist(),
+        "y_test": y_test.tolist(),
+        **metrics,
+    }
+
+
+def _data_digest(X: np.ndarray, y: np.ndarray):
+    # Keyed by the exact arrays the models are fitted on. Hashed once per dtype and copied for each model, so a
+    # run with many models still makes a single pass over the data.
+    digest = hashlib.sha1()
+    for array in (X, y):
+        digest.update(f"{array.dtype}{array.shape}".encode())
+        # Hash the array buffer in place instead of copying it out with tobytes()
+        digest.update(memoryview(np.ascontiguousarray(array)))
+    return digest
+
+
+def _result_cache_path(cache_dir: str, data_digest, model_name: str) -> str:
+    # The data digest plus the model and its grid, so changed data or settings miss the cache
+    digest = data_digest.copy()
+    digest.update(model_name.encode())
+    digest.update(repr(MODEL_MAPPING[model_name][1]).encode())
+    # The search strategy decides which hyperparameters win, so results from a different strategy must miss
+    digest.update(f"halving:{HALVING_FACTOR}:{HALVING_MIN_SAMPLES}:cv{CV_FOLDS}".encode())
+    return os.path.join(cache_dir, f"{digest.hexdigest()}.json")
+
 
-        results[model_name] = {
-            "best_hyperparameters": grid_search.best_params_,
-            "cv_mean_score": -grid_search.best_score_,
-            "cv_std_score": grid_search.cv_results_["std_test_score"][grid_search.best_index_],
-            "test_predictions": test_predictions.tolist(),
-            "y_test": y_test.tolist(),
-            **metrics,
+def _load_cached_result(path: str) -> dict | None:
+    try:
+        with open(path) as f:
+            result = json.load(f)
+        # Mark the entry as recently used, so pruning removes the stale entries first
+        os.utime(path)
+        return result
+    except (OSError, ValueError):
+        return None
+
+
+def _prune_result_cache(cache_dir: str, max_entries: int = RESULT_CACHE_MAX_ENTRIES) -> None:
+    entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".json")]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[: len(entries) - max_entries]:
+        os.remove(entry.path)
+
+
+def _save_cached_result(path: str, result: dict) -> None:
+    # The cache is only an optimisation, so a full disk or unwritable directory must not fail the run
+    cache_dir = os.path.dirname(path)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a unique temporary file first, so a crash or a concurrent save never leaves a truncated entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+        tmp_path = None
+        _prune_result_cache(cache_dir)
+    except OSError as e:
+        logger.warning(f"Could not write ML result cache entry {path}: {e}")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def run_ml_methods_xy(
+    X: np.ndarray,
+    y: np.ndarray,
+    selected_models: list,
+    executor: Executor | None = None,
+    cache_dir: str | None = None,
+    max_concurrency: int | None = None,
+):
+    models = [model_name for model_name in selected_models if model_name in MODEL_MAPPING]
+
+    # Convert and split once per dtype and reuse the arrays for every selected model
+    arrays = {}
+    splits = {}
+    model_dtypes = {}
+    for model_name in models:
+        dtype = np.float32 if ALLOW_FP32 and model_name not in FP64_MODELS else np.float64
+        if dtype not in splits:
+            arrays[dtype] = (np.ascontiguousarray(X, dtype=dtype), np.ascontiguousarray(y, dtype=dtype))
+            splits[dtype] = train_test_split(*arrays[dtype], test_size=0.2, random_state=42)
+        model_dtypes[model_name] = dtype
+
+    cached = {}
+    cache_paths = {}
+    if cache_dir is not None:
+        data_digests = {dtype: _data_digest(*dtype_arrays) for dtype, dtype_arrays in arrays.items()}
+        for model_name in models:
+            cache_paths[model_name] = _result_cache_path(cache_dir, data_digests[model_dtypes[model_name]], model_name)
+            result = _load_cached_result(cache_paths[model_name])
+            if result is not None:
+                cached[model_name] = result
+    to_fit = [model_name for model_name in models if model_name not in cached]
+
+    # A single fit gains nothing from the executor, and a process pool would only add its startup cost
+    if executor is None or len(to_fit) <= 1:
+        fitted = {model_name: _fit_model(model_name, *splits[model_dtypes[model_name]]) for model_name in to_fit}
+    else:
+        # Each model's grid search runs concurrently, so split the cores between them instead of oversubscribing.
+        # At most max_concurrency (the executor's worker count) run at once, so a small pool leaves each fit more.
+        concurrent_fits = min(len(to_fit), max_concurrency or len(to_fit))
+        n_jobs = max(1, (os.cpu_count() or 1) // max(1, concurrent_fits))
+        futures = {
+            model_name: executor.submit(_fit_model, model_name, *splits[model_dtypes[model_name]], n_jobs)
+            for model_name in to_fit
         }
+        fitted = {model_name: future.result() for model_name, future in futures.items()}
+
+    for model_name, result in fitted.items():
+        if model_name in cache_paths:
+            _save_cached_result(cache_paths[model_name], result)
+
+    return {model_name: cached[model_name] if model_name in cached else fitted[model_name] for model_name in models}
 
-    return results
+
+def run_ml_methods(
+    df: pd.DataFrame,
+    target_column: str,
+    feature_columns: list,
+    selected_models: list,
+    executor: Executor | None = None,
+    cache_dir: str | None = None,
+    max_concurrency: int | None = None,
+):
+    X = df[feature_columns].to_numpy()
+    y = df[target_column].to_numpy()
+
+    return run_ml_methods_xy(
+        X, y, selected_models, executor=executor, cache_dir=cache_dir, max_concurrency=max_concurrency
+    )
 
 
 def download_results_as_json(results, filename="ml_results.json"):
+    if orjson is not None:
+        # orjson encodes the long prediction lists in C, several times faster than json.dump. Each model is
+        # encoded and written on its own, so the whole document is never built up as a single bytes object.
+        with open(filename, "wb") as f:
+            if not results:
+                f.write(b"{}")
+                return
+            f.write(b"{")
+            for i, (model_name, result) in enumerate(results.items()):
+                body = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+                # orjson only indents by 2: double each line's indent for the file's 4-space layout, then nest the
+                # member one level in, giving the same layout as json.dump(results, indent=4)
+                body = _INDENT_RE.sub(rb"\1\1", body)
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(orjson.dumps(model_name))
+                f.write(b": ")
+                f.write(body.replace(b"\n", b"\n    "))
+            f.write(b"\n}")
+        return
+
     with open(filename, "w") as f:
         json.dump(results, f, indent=4)
@@ -1,9 +1,10 @@
 import pandas as pd
 import pytest
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QTabWidget
+from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableView, QTabWidget
 
-from gui.csv_view import CSVView
+from gui.csv_view import CSVView, DataFrameModel
+from utils.color_assets import NAN_COLOR, NON_NUM_COLOR
 
 
 @pytest.fixture
@@ -38,7 +39,7 @@ def test_create_filter_button(csv_view):
 
 def test_create_table_widget(csv_view):
     table_widget = csv_view.create_table_widget()
-    assert isinstance(table_widget, QTableWidget)
+    assert isinstance(table_widget, QTableView)
 
 
 def test_create_filter_layout(csv_view):
@@ -52,6 +53,44 @@ def test_load_csv(csv_view, qtbot):
     assert not csv_view.df.empty
 
 
+def test_display_csv_image_loads_in_background(csv_view, qtbot, tmp_path):
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]}).to_csv(csv_file, index=False)
+
+    with qtbot.waitSignal(csv_view.data_ready):
+        csv_view.display_csv_image(str(csv_file))
+    qtbot.waitUntil(lambda: csv_view.load_button.isEnabled())
+
+    assert list(csv_view.df.columns) == ["A", "B"]
+    assert csv_view.table_model.rowCount() == 3
+    assert csv_view.csv_loader is None
+
+
+def test_shutdown_waits_for_loader_without_delivering_results(csv_view, qtbot, tmp_path):
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"A": [1, 2, 3]}).to_csv(csv_file, index=False)
+    received = []
+    csv_view.data_ready.connect(received.append)
+
+    csv_view.display_csv_image(str(csv_file))
+    csv_view.shutdown()
+    qtbot.wait(50)
+
+    assert csv_view._thread_pool.activeThreadCount() == 0
+    assert received == []
+
+
+def test_display_csv_image_reports_errors(csv_view, qtbot, monkeypatch, tmp_path):
+    errors = []
+    monkeypatch.setattr(csv_view, "show_error_message", lambda title, message: errors.append(title))
+
+    csv_view.display_csv_image(str(tmp_path / "missing.csv"))
+    qtbot.waitUntil(lambda: csv_view.load_button.isEnabled())
+
+    assert errors == ["Error loading CSV file"]
+    assert csv_view.df.empty
+
+
 def test_undo(csv_view):
     # Add some data to the undo stack
     csv_view.undo_stack.append(pd.DataFrame())
@@ -133,6 +172,15 @@ def test_apply_filter(csv_view):
     assert filtered_df["column_name"].values[0] == 1
 
 
+def test_apply_filter_text_conditions(csv_view):
+    csv_view.df = pd.DataFrame({"name": ["C1.5", "C115", None], "mass": [1.5, 115.0, None]})
+
+    assert csv_view.apply_filter("name", "Contains", "1.5")["name"].tolist() == ["C1.5"]
+    assert csv_view.apply_filter("name", "Starts with", "C1").shape[0] == 2
+    assert csv_view.apply_filter("mass", "Contains", "15")["mass"].tolist() == [115.0]
+    assert csv_view.apply_filter("mass", "Ends with", ".5")["mass"].tolist() == [1.5]
+
+
 def test_update_table(csv_view):
     # Create a test DataFrame
     df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
@@ -141,18 +189,48 @@ def test_update_table(csv_view):
     csv_view.update_table(df)
 
     # Check if the table is updated correctly
-    assert csv_view.table_widget.rowCount() == len(df)
-    assert csv_view.table_widget.columnCount() == len(df.columns)
-    assert csv_view.table_widget.horizontalHeaderItem(0).text() == "A"
-    assert csv_view.table_widget.horizontalHeaderItem(1).text() == "B"
-    assert csv_view.table_widget.item(0, 0).text() == "1"
-    assert csv_view.table_widget.item(0, 1).text() == "4"
+    model = csv_view.table_widget.model()
+    assert model.rowCount() == len(df)
+    assert model.columnCount() == len(df.columns)
+    assert model.headerData(0, Qt.Horizontal) == "A"
+    assert model.headerData(1, Qt.Horizontal) == "B"
+    assert model.data(model.index(0, 0)) == "1"
+    assert model.data(model.index(0, 1)) == "4"
+
+
+def test_update_table_with_filtered_index(csv_view):
+    # Filtered frames keep their original index labels; cells are still looked up by position
+    df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]}).iloc[[2, 0]]
+
+    csv_view.update_table(df)
+
+    model = csv_view.table_widget.model()
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, 0)) == "3"
+    assert model.data(model.index(1, 1)) == "x"
+
+
+def test_dataframe_model_backgrounds(qtbot):
+    model = DataFrameModel(pd.DataFrame({"num": [1.0, 2.0], "nan": [1.0, None], "text": ["a", None]}))
+
+    assert model.data(model.index(0, 0), Qt.BackgroundRole) is None
+    assert model.data(model.index(0, 1), Qt.BackgroundRole).color() == NAN_COLOR
+    assert model.data(model.index(0, 2), Qt.BackgroundRole).color() == NON_NUM_COLOR
+
+
+def test_dataframe_model_sort(qtbot):
+    model = DataFrameModel(pd.DataFrame({"A": [2, 3, 1], "B": ["b", "c", "a"]}))
+
+    model.sort(0, Qt.DescendingOrder)
+
+    assert [model.data(model.index(row, 1)) for row in range(3)] == ["c", "b", "a"]
 
 
 def test_copy_selected_values(csv_view):
     # Select some cells in the table widget
-    csv_view.table_widget.setCurrentCell(0, 0)
-    csv_view.table_widget.setCurrentCell(1, 1)
+    csv_view.update_table(pd.DataFrame({"A": [1, 2], "B": [3, 4]}))
+    csv_view.table_widget.setCurrentIndex(csv_view.table_model.index(0, 0))
+    csv_view.table_widget.setCurrentIndex(csv_view.table_model.index(1, 1))
 
     # Call the copy_selected_values method
     csv_view.copy_selected_values()
@@ -0,0 +1,463 @@
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pytest
+from PyQt5.QtCore import QItemSelectionModel
+from PyQt5.QtWidgets import QDialog
+
+from gui.ml_view import ML_METHOD_NAMES, MLView, MLWorker
+from ml_backend.ml_backend import MODEL_MAPPING
+
+
+@pytest.fixture
+def ml_view(qtbot):
+    view = MLView()
+    qtbot.addWidget(view)
+    return view
+
+
+@pytest.fixture
+def sample_dataframe():
+    return pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0], "c": [7.0, 8.0, 9.0]})
+
+
+def select_rows(view, *rows):
+    for row in rows:
+        view.selectionModel().select(view.model().index(row), QItemSelectionModel.Select)
+
+
+def test_move_to_selected(ml_view):
+    select_rows(ml_view.available_methods_list, 0, 2)
+
+    ml_view.move_to_selected()
+
+    assert ml_view.get_selected_models() == ["Linear Regression", "Lasso Regression"]
+    assert len(ml_view._available_methods_model.stringList()) == 8
+
+
+def test_move_several_rows_to_selected(ml_view):
+    select_rows(ml_view.available_methods_list, 1, 2, 3, 6)
+
+    ml_view.move_to_selected()
+
+    assert ml_view.get_selected_models() == [
+        "Ridge Regression",
+        "Lasso Regression",
+        "ElasticNet Regression",
+        "Support Vector Machines",
+    ]
+    assert len(ml_view._available_methods_model.stringList()) == 6
+    assert ml_view._available_methods_model.stringList()[1] == "Decision Trees"
+
+
+def test_move_to_available(ml_view):
+    select_rows(ml_view.available_methods_list, 0)
+    ml_view.move_to_selected()
+
+    select_rows(ml_view.selected_methods_list, 0)
+    ml_view.move_to_available()
+
+    assert ml_view.get_selected_models() == []
+    assert len(ml_view._available_methods_model.stringList()) == 10
+
+
+def test_move_feature_to_selected(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 1)
+
+    ml_view.move_feature_to_selected()
+
+    assert ml_view.get_feature_columns() == ["b"]
+    assert ml_view._feature_model.stringList() == ["a", "c"]
+
+
+def test_move_feature_to_available(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 0, 2)
+    ml_view.move_feature_to_selected()
+
+    select_rows(ml_view.selected_feature_list, 0)
+    ml_view.move_feature_to_available()
+
+    assert ml_view.get_feature_columns() == ["c"]
+    assert ml_view._feature_model.stringList() == ["b", "a"]
+
+
+def test_move_buttons_are_wired_to_their_own_lists(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.available_methods_list, 0)
+    select_rows(ml_view.feature_list, 0)
+
+    ml_view.move_right_button.click()
+
+    assert ml_view.get_selected_models() == ["Linear Regression"]
+    assert ml_view.get_feature_columns() == []
+
+    ml_view.feature_move_right_button.click()
+
+    assert ml_view.get_feature_columns() == ["a"]
+
+
+def test_method_names_match_backend_models():
+    assert list(ML_METHOD_NAMES) == list(MODEL_MAPPING)
+
+
+def test_set_data_ready_signal_connects_receiver_once(ml_view, sample_dataframe):
+    calls = []
+
+    def receiver(df):
+        calls.append(df)
+
+    ml_view.set_data_ready_signal(receiver)
+    ml_view.set_data_ready_signal(receiver)
+    ml_view.data_ready_signal.emit(sample_dataframe)
+
+    assert len(calls) == 1
+
+
+def test_prepare_xy_returns_contiguous_arrays(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    ml_view._build_feature_matrix()
+
+    X, y = ml_view._prepare_xy("c", ["b", "a"])
+
+    assert X.flags.c_contiguous and y.flags.c_contiguous
+    assert X.tolist() == [[4.0, 1.0], [5.0, 2.0], [6.0, 3.0]]
+    assert y.tolist() == [7.0, 8.0, 9.0]
+
+
+def test_ml_job_only_uses_process_pool_for_several_methods(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+
+    single = ml_view._ml_job("c", ["a", "b"], ["Ridge Regression"])
+    assert "executor" not in single.keywords
+    assert ml_view._pool is None
+
+    several = ml_view._ml_job("c", ["a", "b"], ["Ridge Regression", "Lasso Regression"])
+    assert several.keywords["executor"] is ml_view._pool
+
+
+def test_target_change_rebuilds_feature_list_after_debounce(ml_view, qtbot, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+
+    ml_view.target_combo.setCurrentText("a")
+    ml_view.target_combo.setCurrentText("b")
+
+    assert ml_view._feature_model.stringList() == ["a", "b", "c"]
+    qtbot.waitUntil(lambda: ml_view._feature_model.stringList() == ["a", "c"])
+
+
+def test_plot_results_do_not_register_pyplot_figures(ml_view, monkeypatch):
+    import matplotlib.pyplot as plt
+
+    monkeypatch.setattr(QDialog, "exec_", lambda self: 0)
+    results = {"Linear Regression": {"y_test": [1.0, 2.0, 3.0], "test_predictions": [1.1, 1.9, 3.2]}}
+
+    ml_view._plot_results(["Linear Regression"], results)
+    ml_view._plot_dialog.finished.emit(0)
+
+    assert plt.get_fignums() == []
+    assert ml_view._plot_fig.axes == []
+
+
+def test_remove_feature(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 0, 1)
+    ml_view.move_feature_to_selected()
+
+    select_rows(ml_view.selected_feature_list, 1)
+    ml_view.remove_feature()
+
+    assert ml_view.get_feature_columns() == ["a"]
+
+
+def test_update_feature_columns_swaps_old_and_new_target(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+
+    ml_view.target_combo.setCurrentText("a")
+    ml_view.update_feature_columns()
+    assert ml_view._feature_model.stringList() == ["b", "c"]
+
+    ml_view.target_combo.setCurrentText("b")
+    ml_view.update_feature_columns()
+    assert ml_view._feature_model.stringList() == ["a", "c"]
+
+    ml_view.target_combo.setCurrentIndex(0)
+    ml_view.update_feature_columns()
+    assert ml_view._feature_model.stringList() == ["a", "b", "c"]
+
+
+def test_update_feature_columns_reinserts_target_after_features_moved_back(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 0)
+    ml_view.move_feature_to_selected()
+    select_rows(ml_view.selected_feature_list, 0)
+    ml_view.move_feature_to_available()
+    assert ml_view._feature_model.stringList() == ["b", "c", "a"]
+
+    ml_view.target_combo.setCurrentText("b")
+    ml_view.update_feature_columns()
+    ml_view.target_combo.setCurrentIndex(0)
+    ml_view.update_feature_columns()
+
+    assert ml_view._feature_model.stringList() == ["b", "c", "a"]
+
+
+def test_same_columns_keep_feature_selection(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 0)
+    ml_view.move_feature_to_selected()
+
+    ml_view.set_dataframe(sample_dataframe.head(2))
+
+    assert ml_view.get_feature_columns() == ["a"]
+    assert ml_view._feature_model.stringList() == ["b", "c"]
+    assert len(ml_view.df) == 2
+
+
+def test_new_columns_reset_feature_selection(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 0)
+    ml_view.move_feature_to_selected()
+
+    ml_view.set_dataframe(sample_dataframe.rename(columns={"a": "d"}))
+
+    assert ml_view.get_feature_columns() == []
+    assert ml_view._feature_model.stringList() == ["d", "b", "c"]
+
+
+def test_new_columns_reset_target(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    ml_view.target_combo.setCurrentText("b")
+    ml_view.update_feature_columns()
+
+    ml_view.set_dataframe(sample_dataframe.rename(columns={"a": "d"}))
+
+    assert ml_view.target_combo.currentIndex() == 0
+    assert ml_view.previous_target_column is None
+    assert ml_view._feature_model.stringList() == ["d", "b", "c"]
+
+
+def test_plot_selected_methods_only_fits_uncached_methods(ml_view, sample_dataframe, monkeypatch):
+    ml_view.set_dataframe(sample_dataframe)
+    ml_view.target_combo.setCurrentText("c")
+    select_rows(ml_view.feature_list, 0, 1)
+    ml_view.move_feature_to_selected()
+
+    key = (ml_view._df_hash, "c", ("a", "b"), 3)
+    ml_view._results_cache[key] = {"Linear Regression": {"y_test": [1.0], "test_predictions": [1.0]}}
+
+    started, plotted = [], []
+    monkeypatch.setattr(ml_view, "_start_worker", lambda job, on_result: started.append(job))
+    monkeypatch.setattr(ml_view, "_plot_results", lambda methods, results: plotted.append(methods))
+
+    ml_view.plot_selected_methods(["Linear Regression"])
+    assert plotted == [["Linear Regression"]]
+    assert started == []
+
+    ml_view.plot_selected_methods(["Linear Regression", "Ridge Regression"])
+    assert started[0].args[2] == ["Ridge Regression"]
+
+
+def test_ml_worker_reports_results_then_finished():
+    worker = MLWorker(lambda: {"Linear Regression": {}})
+    events = []
+    worker.signals.result_ready.connect(lambda results: events.append(("result", results)))
+    worker.signals.error.connect(lambda message: events.append(("error", message)))
+    worker.signals.finished.connect(lambda: events.append(("finished", None)))
+
+    worker.run()
+
+    assert events == [("result", {"Linear Regression": {}}), ("finished", None)]
+
+
+def test_ml_worker_reports_errors_then_finished():
+    def job():
+        raise ValueError("bad input")
+
+    worker = MLWorker(job)
+    events = []
+    worker.signals.result_ready.connect(lambda results: events.append(("result", results)))
+    worker.signals.error.connect(lambda message: events.append(("error", message)))
+    worker.signals.finished.connect(lambda: events.append(("finished", None)))
+
+    worker.run()
+
+    assert events == [("error", "bad input"), ("finished", None)]
+
+
+def test_format_result_string_marks_missing_metrics():
+    result = {"cv_mean_score": 0.5, "cv_std_score": 0.125, "test_r2": 1, "best_hyperparameters": {"alpha": 1.0}}
+
+    text = MLView._format_result_string("Ridge Regression", result)
+
+    assert text == (
+        "Best Method: Ridge Regression\n"
+        "  CV Mean Score: 0.5000\n"
+        "  CV Std Score: 0.1250\n"
+        "  Train MSE: N/A\n"
+        "  Test MSE: N/A\n"
+        "  Train R2: N/A\n"
+        "  Test R2: 1.0000\n"
+        "  Best Hyperparameters: {'alpha': 1.0}\n"
+    )
+
+
+def test_ml_view_defers_matplotlib_and_backend_imports():
+    # A fresh interpreter, so modules already loaded by other tests do not hide a transitive import
+    script = (
+        "import sys, gui.ml_view; "
+        "print(sorted(m for m in ('matplotlib.pyplot', 'sklearn', 'ml_backend.ml_backend') if m in sys.modules))"
+    )
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    output = subprocess.run([sys.executable, "-c", script], cwd=repo_root, capture_output=True, text=True, check=True)
+
+    assert output.stdout.strip() == "[]"
+
+
+def test_plot_results_lays_out_methods_in_a_grid(ml_view, monkeypatch):
+    monkeypatch.setattr(QDialog, "exec_", lambda self: 0)
+    result = {"y_test": [1.0, 2.0, 3.0], "test_predictions": [1.1, 1.9, 3.2]}
+    methods = ["Linear Regression", "Ridge Regression", "Lasso Regression"]
+
+    ml_view._plot_results(methods, dict.fromkeys(methods, result))
+
+    axes = ml_view._plot_fig.axes
+    assert len(axes) == 4
+    assert [ax.get_title() for ax in axes if ax.get_visible()] == [f"{m} - Actual vs Predicted" for m in methods]
+
+
+def test_run_reuses_cached_results_and_merges_new_ones(ml_view, sample_dataframe, monkeypatch):
+    ml_view.set_dataframe(sample_dataframe)
+    ml_view.target_combo.setCurrentText("c")
+    select_rows(ml_view.feature_list, 0, 1)
+    ml_view.move_feature_to_selected()
+    select_rows(ml_view.available_methods_list, 0, 1)
+    ml_view.move_to_selected()
+
+    key = (ml_view._df_hash, "c", ("a", "b"), 3)
+    linear = {"cv_mean_score": 0.1}
+    ridge = {"cv_mean_score": 0.2}
+    ml_view._results_cache[key] = {"Linear Regression": linear}
+
+    started, shown = [], []
+    monkeypatch.setattr(ml_view, "_start_worker", lambda job, on_result: started.append((job, on_result)))
+    monkeypatch.setattr(ml_view, "_on_ml_done", lambda key, results: shown.append(results))
+
+    ml_view.run_ml_methods_clicked()
+    job, on_result = started[0]
+    assert job.args[2] == ["Ridge Regression"]
+
+    on_result({"Ridge Regression": ridge})
+    assert shown == [{"Linear Regression": linear, "Ridge Regression": ridge}]
+    assert ml_view._results_cache[key] == {"Linear Regression": linear, "Ridge Regression": ridge}
+
+    ml_view.run_ml_methods_clicked()
+    assert len(started) == 1
+    assert len(shown) == 2
+
+
+def test_process_pool_is_created_on_first_use_and_recreated_after_shutdown(ml_view):
+    assert ml_view._pool is None
+
+    pool = ml_view._process_pool()
+    assert ml_view._process_pool() is pool
+
+    ml_view.shutdown()
+    assert ml_view._pool is None
+    assert ml_view._process_pool() is not pool
+    ml_view.shutdown()
+
+
+def test_shutdown_kills_running_fit_without_waiting(ml_view):
+    pool = ml_view._process_pool()
+    pool.submit(os.getpid).result()
+    future = pool.submit(time.sleep, 60)
+    time.sleep(0.5)
+
+    start = time.perf_counter()
+    ml_view.shutdown()
+
+    with pytest.raises((BrokenProcessPool, CancelledError)):
+        future.result(timeout=10)
+    assert time.perf_counter() - start < 10
+
+
+def test_result_disk_cache_is_opt_in(qtbot, monkeypatch, tmp_path):
+    monkeypatch.delenv("CHEMML_RESULT_CACHE_DIR", raising=False)
+    default_view = MLView()
+    qtbot.addWidget(default_view)
+    assert default_view.result_cache_dir is None
+
+    monkeypatch.setenv("CHEMML_RESULT_CACHE_DIR", str(tmp_path))
+    cached_view = MLView()
+    qtbot.addWidget(cached_view)
+    assert cached_view.result_cache_dir == str(tmp_path)
+
+
+def test_set_dataframe_clears_results_cache(ml_view, sample_dataframe):
+    ml_view._results_cache[("old",)] = {"Linear Regression": {}}
+
+    ml_view.set_dataframe(sample_dataframe)
+
+    assert ml_view._results_cache == {}
+
+
+def test_update_feature_columns_keeps_available_selection(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    select_rows(ml_view.feature_list, 2)
+
+    ml_view.target_combo.setCurrentText("a")
+    ml_view.update_feature_columns()
+
+    selected = [index.data() for index in ml_view.feature_list.selectionModel().selectedIndexes()]
+    assert selected == ["c"]
+
+
+def test_set_dataframe_keeps_cache_for_identical_data(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+    ml_view._results_cache[(ml_view._df_hash,)] = {"Linear Regression": {}}
+
+    ml_view.set_dataframe(sample_dataframe.copy())
+    assert ml_view._results_cache != {}
+
+    ml_view.set_dataframe(sample_dataframe.assign(a=[0.0, 0.0, 0.0]))
+    assert ml_view._results_cache == {}
+
+
+def test_set_dataframe_only_converts_repeated_strings(ml_view):
+    df = pd.DataFrame(
+        {
+            "x": [1.0, 2.0, 3.0, 4.0],
+            "n": [1, 2, 3, 4],
+            "solvent": ["water", "water", "water", "ethanol"],
+            "name": ["a", "b", "c", "d"],
+        }
+    )
+
+    ml_view.set_dataframe(df)
+
+    assert ml_view.df["x"].dtype == df["x"].dtype
+    assert ml_view.df["n"].dtype == df["n"].dtype
+    assert ml_view.df["solvent"].dtype == "category"
+    assert ml_view.df["name"].dtype == object
+    assert df["solvent"].dtype == object
+
+
+def test_set_dataframe_skips_strings_of_categorized_frames(ml_view):
+    df = pd.DataFrame({"solvent": ["water", "water", "water", "ethanol"], "x": [1.0, 2.0, 3.0, 4.0]})
+
+    ml_view.set_dataframe(df, categorized=True)
+
+    assert ml_view.df is df
+
+
+def test_set_dataframe_keeps_numeric_frame_without_copying(ml_view, sample_dataframe):
+    ml_view.set_dataframe(sample_dataframe)
+
+    assert ml_view.df is sample_dataframe
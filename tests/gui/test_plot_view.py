@@ -1,9 +1,13 @@
+from unittest import mock
+
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pytest
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 
-from gui.plot_view import PlottingWidget
+from gui.plot_view import LARGE_COLUMN_THRESHOLD, PlottingWidget, linear_fit
 
 
 @pytest.fixture
@@ -22,6 +26,22 @@ def test_plot_data(sample_dataframe, qtbot):
     assert widget.current_plot is not None
 
 
+def test_option_dialogs_are_built_on_first_use(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+
+    assert widget._marker_options_dialog is None
+    assert widget._line_fit_options_dialog is None
+    assert widget._axes_options_dialog is None
+
+    dialog = widget.axes_options_dialog
+    assert widget.axes_options_dialog is dialog
+
+    dialog.x_title_input.setText("Time")
+    dialog.apply_options()
+    assert widget.x_title == "Time"
+
+
 def test_update_plot(sample_dataframe, qtbot):
     widget = PlottingWidget(sample_dataframe)
     qtbot.addWidget(widget)
@@ -35,15 +55,221 @@ def test_update_plot(sample_dataframe, qtbot):
     assert widget.current_plot is not None
 
 
-def test_start_timer(sample_dataframe, qtbot):
+def test_linear_fit_matches_polyfit():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=200)
+    y = 3 * x - 2 + rng.normal(scale=0.1, size=200)
+
+    slope, intercept, r_squared = linear_fit(x, y)
+
+    np.testing.assert_allclose((slope, intercept), np.polyfit(x, y, 1))
+    residuals = y - (slope * x + intercept)
+    assert r_squared == pytest.approx(1 - np.sum(residuals**2) / np.sum((y - y.mean()) ** 2))
+
+
+def test_linear_fit_constant_x():
+    assert linear_fit(np.ones(3), np.array([1.0, 2.0, 3.0])) == (0.0, 2.0, 0.0)
+
+
+def test_linear_fit_on_offset_data():
+    rng = np.random.default_rng(0)
+    x_small = rng.normal(size=200)
+    y_small = 3 * x_small - 2 + rng.normal(scale=0.1, size=200)
+
+    slope, intercept, r_squared = linear_fit(x_small + 1e8, y_small + 1e8)
+
+    expected_slope, expected_intercept = np.polyfit(x_small, y_small, 1)
+    assert slope == pytest.approx(expected_slope)
+    assert intercept == pytest.approx(1e8 + expected_intercept - expected_slope * 1e8)
+    _, _, expected_r_squared = linear_fit(x_small, y_small)
+    assert r_squared == pytest.approx(expected_r_squared)
+
+
+def test_linear_fit_constant_offset_x():
+    slope, intercept, r_squared = linear_fit(np.full(5, 1e8 + 0.1), np.arange(5.0) + 1e8)
+
+    assert slope == 0.0
+    assert intercept == pytest.approx(1e8 + 2)
+    assert r_squared == 0.0
+
+
+def test_update_plot_fits_once_for_line_and_r_squared(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.line_fit_options_dialog.line_fit_checkbox.setChecked(True)
+    widget.line_fit_options_dialog.r_squared_checkbox.setChecked(True)
+
+    with mock.patch("gui.plot_view.linear_fit", wraps=linear_fit) as fit:
+        widget.plot_data()
+
+    assert fit.call_count == 1
+
+
+def test_update_plot_reuses_fit_for_style_changes(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.line_fit_options_dialog.line_fit_checkbox.setChecked(True)
+
+    widget.plot_data()
+    with mock.patch("gui.plot_view.linear_fit", wraps=linear_fit) as fit:
+        widget.marker_options_dialog.marker_size_slider.setValue(10)
+        widget.update_plot()
+
+    fit.assert_not_called()
+
+
+def test_update_data_clears_cached_arrays(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.plot_data()
+
+    widget.update_data(pd.DataFrame({"x": [1, 2, 3], "y": [2, 4, 6]}))
+
+    assert widget._column_arrays == {}
+    assert widget._fit_cache == {}
+
+
+def test_update_plot_restyles_existing_artists(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.line_fit_options_dialog.line_fit_checkbox.setChecked(True)
+    widget.plot_data()
+    scatter, trend_line = widget._scatter, widget._trend_line
+
+    widget.marker_options_dialog.marker_size_slider.setValue(12)
+    widget.line_fit_options_dialog.line_type_combo.setCurrentText("Dashed")
+    widget.update_plot()
+
+    assert widget._scatter is scatter
+    assert widget._trend_line is trend_line
+    assert list(scatter.get_sizes()) == [12]
+    assert trend_line.get_linestyle() == "--"
+
+    widget.line_fit_options_dialog.line_fit_checkbox.setChecked(False)
+    widget.update_plot()
+
+    assert widget._trend_line is None
+    assert trend_line not in widget._ax.lines
+
+
+def test_trend_line_spans_data_with_two_points(qtbot):
+    widget = PlottingWidget(pd.DataFrame({"x": [3.0, 1.0, 5.0, 2.0], "y": [6.0, 2.0, 10.0, 4.0]}))
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.line_fit_options_dialog.line_fit_checkbox.setChecked(True)
+    widget.plot_data()
+
+    line_x, line_y = widget._trend_line.get_data()
+
+    np.testing.assert_allclose(line_x, [1.0, 5.0])
+    np.testing.assert_allclose(line_y, [2.0, 10.0])
+
+
+def test_update_plot_skips_redraw_when_nothing_changed(sample_dataframe, qtbot):
     widget = PlottingWidget(sample_dataframe)
     qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.plot_data()
+
+    with mock.patch("gui.plot_view.plt.draw") as draw:
+        widget.update_plot()
+        draw.assert_not_called()
+
+        widget.marker_options_dialog.marker_size_slider.setValue(12)
+        widget.update_plot()
+        draw.assert_called_once()
+
+
+def test_update_plot_reuses_scatter_for_new_columns(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe.assign(z=[50, 40, 30, 20, 10]))
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.plot_data()
+    scatter = widget._scatter
+
+    widget.y_combo.setCurrentText("z")
+    widget.update_plot()
 
-    assert not widget.timer.isActive()
+    assert widget._scatter is scatter
+    assert len(widget._ax.collections) == 1
+    np.testing.assert_allclose(scatter.get_offsets()[:, 1], [50, 40, 30, 20, 10])
+    ylim = widget._ax.get_ylim()
+    assert ylim[0] <= 10 and ylim[1] >= 50
+
+
+def test_update_plot_drops_rows_with_missing_values(qtbot):
+    widget = PlottingWidget(pd.DataFrame({"x": [1.0, 2.0, None, 4.0], "y": [2, 4, 6, None]}))
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.line_fit_options_dialog.r_squared_checkbox.setChecked(True)
+    widget.plot_data()
+
+    np.testing.assert_allclose(widget._scatter.get_offsets(), [[1.0, 2.0], [2.0, 4.0]])
+    assert widget._fit_cache[("x", "y")] == pytest.approx((2.0, 0.0, 1.0))
+
+
+def test_large_columns_are_plotted_as_float32(qtbot):
+    x = np.arange(LARGE_COLUMN_THRESHOLD, dtype=np.float64)
+    widget = PlottingWidget(pd.DataFrame({"x": x, "y": 2 * x + 1}))
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("y")
+    widget.line_fit_options_dialog.r_squared_checkbox.setChecked(True)
+    widget.plot_data()
+
+    assert widget._column_arrays["x"].dtype == np.float32
+    assert widget._fit_cache[("x", "y")] == pytest.approx((2.0, 1.0, 1.0))
+
+
+def test_plot_data_rejects_non_numeric_columns(qtbot):
+    widget = PlottingWidget(pd.DataFrame({"x": [1, 2], "name": ["a", "b"]}))
+    qtbot.addWidget(widget)
+    widget.x_combo.setCurrentText("x")
+    widget.y_combo.setCurrentText("name")
 
-    widget.start_timer()
+    with mock.patch.object(widget, "show_warning_message") as warning:
+        widget.plot_data()
 
-    assert widget.timer.isActive()
+    warning.assert_called_once_with("Invalid Data", "X and Y data must be numeric.")
+    assert widget._scatter is None
+
+
+def test_scroll_zoom_requests_idle_redraw(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.plot_data()
+    xlim = plt.gca().get_xlim()
+
+    event = mock.Mock(button="up", canvas=mock.Mock(), inaxes=None, xdata=None, ydata=None)
+    widget.on_scroll(event)
+
+    event.canvas.draw_idle.assert_called_once()
+    new_xlim = plt.gca().get_xlim()
+    assert new_xlim[1] - new_xlim[0] < xlim[1] - xlim[0]
+
+
+def test_scroll_zoom_keeps_cursor_point_fixed(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.plot_data()
+    ax = plt.gca()
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 20)
+
+    widget.on_scroll(mock.Mock(button="up", canvas=mock.Mock(), inaxes=ax, xdata=2.0, ydata=15.0))
+
+    np.testing.assert_allclose(ax.get_xlim(), [2 - 2 / 1.2, 2 + 8 / 1.2])
+    np.testing.assert_allclose(ax.get_ylim(), [15 - 15 / 1.2, 15 + 5 / 1.2])
 
 
 def test_update_data(sample_dataframe, qtbot):
@@ -57,6 +283,27 @@ def test_update_data(sample_dataframe, qtbot):
     assert widget.df.equals(new_dataframe)
 
 
+def test_update_data_keeps_selection_for_same_columns(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+    widget.y_combo.setCurrentText("y")
+
+    widget.update_data(pd.DataFrame({"x": [1, 2, 3], "y": [2, 4, 6]}))
+
+    assert widget.y_combo.currentText() == "y"
+    assert widget.y_combo.count() == 2
+
+
+def test_update_data_rebuilds_combos_for_new_columns(sample_dataframe, qtbot):
+    widget = PlottingWidget(sample_dataframe)
+    qtbot.addWidget(widget)
+
+    widget.update_data(pd.DataFrame({"a": [1], "b": [2], "c": [3]}))
+
+    assert [widget.x_combo.itemText(i) for i in range(widget.x_combo.count())] == ["a", "b", "c"]
+    assert widget.y_combo.count() == 3
+
+
 def test_select_marker_color(sample_dataframe, qtbot):
     widget = PlottingWidget(sample_dataframe)
     qtbot.addWidget(widget)
@@ -83,14 +330,14 @@ def test_get_line_style(sample_dataframe, qtbot):
     widget = PlottingWidget(sample_dataframe)
     qtbot.addWidget(widget)
 
-    widget.line_type_combo.setCurrentText("Dashed")
+    widget.line_fit_options_dialog.line_type_combo.setCurrentText("Dashed")
     assert widget.get_line_style() == "--"
 
-    widget.line_type_combo.setCurrentText("Dotted")
+    widget.line_fit_options_dialog.line_type_combo.setCurrentText("Dotted")
     assert widget.get_line_style() == ":"
 
-    widget.line_type_combo.setCurrentText("DashDot")
+    widget.line_fit_options_dialog.line_type_combo.setCurrentText("DashDot")
     assert widget.get_line_style() == "-."
 
-    widget.line_type_combo.setCurrentText("Solid")
+    widget.line_fit_options_dialog.line_type_combo.setCurrentText("Solid")
     assert widget.get_line_style() == "-"
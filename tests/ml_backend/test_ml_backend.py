@@ -0,0 +1,177 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ml_backend.ml_backend import (
+    HALVING_MIN_SAMPLES,
+    _data_digest,
+    _make_search,
+    _prune_result_cache,
+    _save_cached_result,
+    download_results_as_json,
+    run_ml_methods,
+    run_ml_methods_xy,
+)
+
+
+class TestMLBackend(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x1 = rng.normal(size=50)
+        x2 = rng.normal(size=50)
+        self.df = pd.DataFrame({"x1": x1, "x2": x2, "y": 3 * x1 - 2 * x2 + rng.normal(scale=0.1, size=50)})
+
+    def test_run_ml_methods_returns_selected_models(self):
+        results = run_ml_methods(self.df, "y", ["x1", "x2"], ["Linear Regression", "Ridge Regression"])
+        self.assertEqual(set(results), {"Linear Regression", "Ridge Regression"})
+        self.assertEqual(len(results["Linear Regression"]["y_test"]), 10)
+        self.assertGreater(results["Linear Regression"]["test_r2"], 0.9)
+
+    def test_run_ml_methods_results_are_json_serializable(self):
+        results = run_ml_methods(self.df, "y", ["x1", "x2"], ["Linear Regression", "Support Vector Machines"])
+        json.dumps(results)
+
+    def test_run_ml_methods_with_executor_matches_sequential(self):
+        models = ["Linear Regression", "Ridge Regression"]
+        sequential = run_ml_methods(self.df, "y", ["x1", "x2"], models)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            concurrent = run_ml_methods(self.df, "y", ["x1", "x2"], models, executor=executor, max_concurrency=2)
+        self.assertEqual(sequential, concurrent)
+
+    def test_run_ml_methods_with_process_pool_matches_sequential(self):
+        models = ["Linear Regression", "Ridge Regression"]
+        sequential = run_ml_methods(self.df, "y", ["x1", "x2"], models)
+        # Same start method as the ML view, so the fitted function and its arguments must pickle
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+            concurrent = run_ml_methods(self.df, "y", ["x1", "x2"], models, executor=executor, max_concurrency=2)
+        self.assertEqual(sequential, concurrent)
+
+    def test_single_model_is_fitted_without_the_executor(self):
+        executor = mock.Mock()
+        results = run_ml_methods(self.df, "y", ["x1", "x2"], ["Ridge Regression"], executor=executor)
+        executor.submit.assert_not_called()
+        self.assertIn("Ridge Regression", results)
+
+    def test_run_ml_methods_xy_matches_dataframe_path(self):
+        X = self.df[["x1", "x2"]].to_numpy()
+        y = self.df["y"].to_numpy()
+        self.assertEqual(
+            run_ml_methods_xy(X, y, ["Linear Regression"]),
+            run_ml_methods(self.df, "y", ["x1", "x2"], ["Linear Regression"]),
+        )
+
+    def test_run_ml_methods_skips_unknown_models(self):
+        results = run_ml_methods(self.df, "y", ["x1", "x2"], ["Unknown Model"])
+        self.assertEqual(results, {})
+
+    def test_download_results_as_json(self):
+        results = run_ml_methods(self.df, "y", ["x1", "x2"], ["Ridge Regression"])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "results.json")
+            download_results_as_json(results, filename)
+            with open(filename) as f:
+                saved = json.load(f)
+        self.assertEqual(saved["Ridge Regression"]["y_test"], results["Ridge Regression"]["y_test"])
+        self.assertEqual(saved["Ridge Regression"]["test_r2"], results["Ridge Regression"]["test_r2"])
+
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_download_results_as_json_matches_stdlib_layout(self):
+        results = {
+            "Ridge Regression": {"best_hyperparameters": {"alpha": 1.0}, "y_test": [1.0, 2.0], "test_r2": 0.5},
+            "Lasso Regression": {"best_hyperparameters": {}, "y_test": [], "test_r2": 0.25},
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "results.json")
+            for payload in (results, {}):
+                download_results_as_json(payload, filename)
+                with open(filename, "rb") as f:
+                    self.assertEqual(f.read(), json.dumps(payload, indent=4).encode())
+
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_download_results_as_json_fallback_matches_orjson_layout(self):
+        results = {"Ridge Regression": {"best_hyperparameters": {"alpha": 1.0}, "y_test": [1.5, 2.0], "test_r2": 0.5}}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fast_file = os.path.join(tmp_dir, "fast.json")
+            fallback_file = os.path.join(tmp_dir, "fallback.json")
+            download_results_as_json(results, fast_file)
+            with mock.patch("ml_backend.ml_backend.orjson", None):
+                download_results_as_json(results, fallback_file)
+            with open(fast_file, "rb") as fast, open(fallback_file, "rb") as fallback:
+                self.assertEqual(fast.read(), fallback.read())
+
+    def test_run_ml_methods_reuses_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = run_ml_methods(self.df, "y", ["x1", "x2"], ["Ridge Regression"], cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            with mock.patch("ml_backend.ml_backend._fit_model") as fit_model:
+                second = run_ml_methods(self.df, "y", ["x1", "x2"], ["Ridge Regression"], cache_dir=cache_dir)
+            fit_model.assert_not_called()
+
+        self.assertEqual(first, second)
+
+    def test_disk_cache_misses_when_data_changes(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            run_ml_methods(self.df, "y", ["x1", "x2"], ["Ridge Regression"], cache_dir=cache_dir)
+            changed = self.df.assign(y=self.df["y"] + 1)
+            run_ml_methods(changed, "y", ["x1", "x2"], ["Ridge Regression"], cache_dir=cache_dir)
+
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_disk_cache_hashes_data_once_per_dtype(self):
+        models = ["Linear Regression", "Ridge Regression", "Lasso Regression"]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch("ml_backend.ml_backend._data_digest", wraps=_data_digest) as data_digest:
+                run_ml_methods(self.df, "y", ["x1", "x2"], models, cache_dir=cache_dir)
+            data_digest.assert_called_once()
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+    def test_disk_cache_write_failure_does_not_fail_run(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch("ml_backend.ml_backend.os.replace", side_effect=OSError("disk full")):
+                results = run_ml_methods(self.df, "y", ["x1", "x2"], ["Ridge Regression"], cache_dir=cache_dir)
+
+            self.assertIn("Ridge Regression", results)
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_save_cached_result_ignores_unusable_cache_dir(self):
+        with tempfile.NamedTemporaryFile() as not_a_dir:
+            _save_cached_result(os.path.join(not_a_dir.name, "entry.json"), {"test_r2": 1.0})
+
+    def test_prune_result_cache_removes_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for i, name in enumerate(["old", "mid", "new"]):
+                path = os.path.join(cache_dir, f"{name}.json")
+                _save_cached_result(path, {})
+                os.utime(path, (i, i))
+
+            _prune_result_cache(cache_dir, max_entries=2)
+
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["mid.json", "new.json"])
+
+    def test_make_search_uses_halving_for_grids_on_enough_rows(self):
+        search = _make_search(Ridge(), {"alpha": [0.1, 1.0]}, HALVING_MIN_SAMPLES, n_jobs=1)
+        self.assertIsInstance(search, HalvingGridSearchCV)
+
+    def test_make_search_falls_back_to_exhaustive_search(self):
+        self.assertIsInstance(_make_search(Ridge(), {"alpha": [0.1, 1.0]}, HALVING_MIN_SAMPLES - 1, 1), GridSearchCV)
+        self.assertIsInstance(_make_search(LinearRegression(), {}, 1000, n_jobs=1), GridSearchCV)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
+import os
+import tempfile
 import unittest
 
 import pandas as pd
 
-from utils.data_utils import impute_values, one_hot_encode, validate_csv
+from utils.data_utils import categorize_strings, impute_values, one_hot_encode, read_csv, validate_csv
 
 
 class TestDataUtils(unittest.TestCase):
@@ -72,6 +74,28 @@ class TestDataUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             impute_values(self.df, "Value", method="invalid_method")
 
+    def test_read_csv_matches_default_parser(self):
+        df = self.df.assign(Date=["2024-01-01", "2024-01-02", "", "2024-01-04"], Quoted=['a "b"', "NA", "c,d", "e"])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "data.csv")
+            df.to_csv(filename, index=False)
+            result = read_csv(filename)
+            pd.testing.assert_frame_equal(result, pd.read_csv(filename))
+            self.assertEqual(result["Date"].dtype, object)
+
+    def test_categorize_strings_converts_repeated_strings(self):
+        df = pd.DataFrame({"label": ["a", "b", "a", "b", "a"], "name": ["v", "w", "x", "y", "z"], "value": range(5)})
+
+        result = categorize_strings(df)
+
+        self.assertIsInstance(result["label"].dtype, pd.CategoricalDtype)
+        self.assertEqual(result["name"].dtype, object)
+        self.assertEqual(result["label"].tolist(), df["label"].tolist())
+        self.assertEqual(df["label"].dtype, object)
+
+    def test_categorize_strings_returns_same_frame_when_nothing_repeats(self):
+        self.assertIs(categorize_strings(self.df), self.df)
+
 
 if __name__ == "__main__":
     unittest.main()
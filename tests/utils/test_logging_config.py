@@ -0,0 +1,36 @@
+import os
+import unittest
+from unittest import mock
+
+from utils.logging_config import profiled
+
+
+def add(a, b):
+    return a + b
+
+
+class TestProfiled(unittest.TestCase):
+    def test_returns_function_unchanged_when_disabled(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertIs(profiled(add), add)
+
+    def test_logs_profile_when_enabled(self):
+        with mock.patch.dict(os.environ, {"CHEMML_PROFILE": "1"}):
+            wrapped = profiled(add)
+
+        with self.assertLogs("Profile", level="INFO") as logs:
+            self.assertEqual(wrapped(1, 2), 3)
+
+        self.assertEqual(wrapped.__name__, "add")
+        self.assertIn("add", logs.output[0])
+
+    def test_ignores_surplus_positional_arguments(self):
+        with mock.patch.dict(os.environ, {"CHEMML_PROFILE": "1"}):
+            wrapped = profiled(add)
+
+        with self.assertLogs("Profile", level="INFO"):
+            self.assertEqual(wrapped(1, 2, False), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
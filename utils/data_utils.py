@@ -1,6 +1,21 @@
 import pandas as pd
-from sklearn.experimental import enable_iterative_imputer  # noqa
-from sklearn.impute import IterativeImputer, KNNImputer
+
+
+def read_csv(csv_file):
+    # The default C parser, not pyarrow's: pyarrow parses ISO dates to datetime64 and treats quoting and NA tokens
+    # differently, so the dtypes every view works with would depend on whether pyarrow is installed
+    return pd.read_csv(csv_file)
+
+
+def categorize_strings(df):
+    # Store repeated strings (fewer distinct values than half the rows) once each as categories; string
+    # columns are usually the bulk of a CSV's memory. Returns the same frame when nothing qualifies.
+    category_columns = [
+        column for column in df.select_dtypes(include="object").columns if df[column].nunique() < len(df) / 2
+    ]
+    if not category_columns:
+        return df
+    return df.astype({column: "category" for column in category_columns})
 
 
 def one_hot_encode(df, column_name, n_distinct=True):
@@ -50,6 +65,9 @@ def impute_values(df: pd.DataFrame, column_name: str, method: str = "mean"):
         if df.select_dtypes(include=["number"]).empty:
             raise ValueError("No numerical columns found in DataFrame.")
 
+        # scikit-learn is imported only here, so importing this module (as the views do) does not load it
+        from sklearn.impute import KNNImputer
+
         numerical_df = df.select_dtypes(include=["number"])
         imputer = KNNImputer(n_neighbors=5)
         imputed_data = imputer.fit_transform(numerical_df)
@@ -58,6 +76,9 @@ def impute_values(df: pd.DataFrame, column_name: str, method: str = "mean"):
         if df.select_dtypes(include=["number"]).empty:
             raise ValueError("No numerical columns found in DataFrame.")
 
+        from sklearn.experimental import enable_iterative_imputer  # noqa
+        from sklearn.impute import IterativeImputer
+
         numerical_df = df.select_dtypes(include=["number"])
         imputer = IterativeImputer(max_iter=10, random_state=0)
         imputed_data = imputer.fit_transform(numerical_df)
@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+
 import numpy as np
 from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtWidgets import QAbstractItemView, QWidget
 
 
 def pil_image_to_pixmap(pil_image):
@@ -19,3 +22,19 @@ def pil_image_to_pixmap(pil_image):
 
     # Convert QImage to QPixmap
     return QPixmap.fromImage(q_image)
+
+
+@contextmanager
+def updates_suppressed(*widgets: QWidget):
+    # Disable painting and signals on the widgets for a batch of edits, then repaint each once
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+            # Item views paint their rows on the viewport, not on the view itself
+            (widget.viewport() if isinstance(widget, QAbstractItemView) else widget).update()
@@ -1,5 +1,10 @@
+import cProfile
+import inspect
+import io
 import logging
 import os
+import pstats
+from functools import wraps
 
 
 def setup_logging():
@@ -56,3 +61,28 @@ def log_warning(message):
 def log_info(message):
     logger = logging.getLogger()
     logger.info(message)
+
+
+# Set CHEMML_PROFILE=1 to log a cProfile summary of every call to a function decorated with @profiled
+def profiled(func):
+    if not os.environ.get("CHEMML_PROFILE"):
+        return func
+
+    code = func.__code__
+    max_args = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # Drop surplus signal arguments (e.g. clicked's checked flag) the way PyQt does for undecorated slots
+        args = args[:max_args]
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(20)
+            logging.getLogger("Profile").info(f"{func.__qualname__}\n{stream.getvalue()}")
+
+    return wrapper
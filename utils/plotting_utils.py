@@ -12,6 +12,12 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
 )
 
+# Marker combo text -> matplotlib marker, built once instead of on every redraw
+MARKER_SYMBOLS = {"Circle": "o", "Square": "s", "Triangle": "^", "Diamond": "D"}
+
+# Line type combo text -> matplotlib linestyle, likewise hoisted out of the redraw path
+LINE_STYLES = {"Solid": "-", "Dashed": "--", "Dotted": ":", "DashDot": "-."}
+
 
 class AxesOptionsDialog(QDialog):
     options_applied = pyqtSignal()
@@ -103,8 +109,7 @@ class MarkerOptionsDialog(QDialog):
             self.marker_color = color
 
     def get_marker_symbol(self) -> str:
-        symbol_mapping = {"Circle": "o", "Square": "s", "Triangle": "^", "Diamond": "D"}
-        return symbol_mapping.get(self.marker_type_combo.currentText(), "o")
+        return MARKER_SYMBOLS.get(self.marker_type_combo.currentText(), "o")
 
     def apply_options(self) -> None:
         self.options_applied.emit()
@@ -155,5 +160,8 @@ class LineFitOptionsDialog(QDialog):
         if color.isValid():
             self.line_fit_color = color
 
+    def get_line_style(self) -> str:
+        return LINE_STYLES.get(self.line_type_combo.currentText(), "-")
+
     def apply_options(self) -> None:
         self.options_applied.emit()